@@ -6,21 +6,34 @@ This module provides a comprehensive CLI for interacting with the Hire.AI
 agentic system using AutoGen AgentChat patterns.
 """
 
+import os
+import atexit
 import sys
+import json
+import heapq
+import shutil
 import asyncio
+import logging
 import argparse
+import threading
 from pathlib import Path
-from typing import Optional, Dict, Any
+from itertools import islice
+from typing import Optional, Dict, Any, List, Tuple
+
+# Optional: faster JSON serialization for saved results
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Add the project root to the Python path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from agents.orchestrator.main import HireAIOrchestrator, JobSearchRequest
-from agents.job_search.agent import JobSearchAgent, JobSearchCriteria
-from agents.tools.database_search_tool import DatabaseSearchTool
-from agents.tools.hybrid_search_tool import HybridSearchTool
-from loguru import logger
+# Agent and tool modules pull in the AutoGen/OpenAI/pandas/psycopg2 stacks, so
+# they are imported inside the command handlers that need them. This keeps
+# `--help` and argument errors limited to the cost of argparse.
+logger = logging.getLogger("hireai.cli")
 
 
 def setup_application(verbose: bool = False) -> None:
@@ -31,22 +44,56 @@ def setup_application(verbose: bool = False) -> None:
         verbose: Enable verbose logging
     """
     try:
-        import os
         from dotenv import load_dotenv
+        from agents.core.config import OpenAIConfig
+        from agents.core.exceptions import ConfigurationError
         
         # Load environment variables
         load_dotenv(".env.agents")
         
-        # Check for required environment variables
-        if not os.getenv("OPENAI_API_KEY"):
-            print("❌ Error: OPENAI_API_KEY environment variable not set")
+        # Validate the API key with the config layer's rules (this also rejects
+        # the .env template placeholder). The full AgentConfig is not loaded
+        # here because it requires the Go scraper binary, which the database
+        # and hybrid commands do not need.
+        try:
+            OpenAIConfig(api_key=os.environ.get("OPENAI_API_KEY", ""))
+        except ConfigurationError as e:
+            print(f"❌ Error: {e}")
             print("💡 Please create .env.agents file with your OpenAI API key")
             sys.exit(1)
         
         # Configure logging level
         log_level = "DEBUG" if verbose else "INFO"
-        logger.remove()  # Remove default handler
-        logger.add(sys.stderr, level=log_level)
+        
+        # Only our own stdlib loggers (the CLI and agents.core.resilience) get
+        # the handler. The root logger is left alone so httpx, openai and
+        # autogen_core don't flood stderr with their INFO/DEBUG event logs.
+        handler = logging.StreamHandler(sys.stderr)
+        handler.setFormatter(logging.Formatter("%(asctime)s | %(levelname)-8s | %(name)s - %(message)s"))
+        for name in ("hireai", "agents"):
+            app_logger = logging.getLogger(name)
+            app_logger.setLevel(log_level)
+            app_logger.handlers = [handler]
+            app_logger.propagate = False
+        
+        # Agent modules log through loguru; give it the same level, sink and
+        # a plain format. backtrace/diagnose are off so errors don't trigger
+        # frame variable inspection; expensive debug messages should use
+        # logger.opt(lazy=True).debug("...", lambda: ...). enqueue moves
+        # formatting and the stderr write to loguru's worker thread, so agent
+        # and network code only pay for a queue put.
+        from loguru import logger as agent_logger
+        agent_logger.remove()  # Remove default handler
+        agent_logger.add(
+            sys.stderr,
+            level=log_level,
+            format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name} - {message}",
+            colorize=False,
+            backtrace=False,
+            diagnose=False,
+            enqueue=True
+        )
+        atexit.register(agent_logger.complete)  # Flush queued records on exit
         
         logger.info("Application setup completed successfully")
         
@@ -55,6 +102,60 @@ def setup_application(verbose: bool = False) -> None:
         sys.exit(1)
 
 
+async def connect_orchestrator():
+    """
+    Get an orchestrator, preferring a running daemon over a new instance.
+    
+    Returns:
+        OrchestratorClient connected to the daemon, or a new HireAIOrchestrator
+    """
+    from agents.orchestrator.daemon import OrchestratorClient
+    
+    client = await OrchestratorClient.connect()
+    if client is not None:
+        print("🤖 Connected to running Hire.AI orchestrator daemon")
+        return client
+    
+    print("🤖 Initializing Hire.AI AutoGen Orchestrator...")
+    return await create_local_orchestrator()
+
+
+async def create_local_orchestrator():
+    """
+    Create a new in-process orchestrator.
+    
+    Importing the AutoGen stack and building the agent team happens here,
+    so callers can run this as a task to overlap it with other waiting.
+    
+    Returns:
+        New HireAIOrchestrator
+    """
+    from agents.orchestrator.main import HireAIOrchestrator
+    return HireAIOrchestrator()
+
+
+async def run_daemon(args: argparse.Namespace) -> None:
+    """
+    Run the orchestrator daemon that keeps agents warm between CLI calls.
+    
+    Args:
+        args: Command line arguments
+    """
+    from agents.orchestrator.daemon import serve, default_socket_path
+    
+    socket_path = args.socket or default_socket_path()
+    print(f"🤖 Starting Hire.AI orchestrator daemon on {socket_path}")
+    print("Press Ctrl+C to stop.\n")
+    
+    try:
+        await serve(socket_path)
+    except asyncio.CancelledError:
+        print("\n👋 Daemon stopped")
+    except Exception as e:
+        logger.error("Daemon failed: %s", e)
+        print(f"❌ Error: {e}")
+
+
 async def run_orchestrator_search(args: argparse.Namespace) -> None:
     """
     Run a job search using the AutoGen orchestrator.
@@ -62,11 +163,9 @@ async def run_orchestrator_search(args: argparse.Namespace) -> None:
     Args:
         args: Command line arguments
     """
-    print("🤖 Initializing Hire.AI AutoGen Orchestrator...")
-    
     orchestrator = None
     try:
-        orchestrator = HireAIOrchestrator()
+        orchestrator = await connect_orchestrator()
         
         print(f"🔍 Searching for: {args.keywords}")
         print(f"📍 Locations: {args.location}")
@@ -84,28 +183,119 @@ async def run_orchestrator_search(args: argparse.Namespace) -> None:
         
         # Save results if requested
         if args.output:
-            # Read the latest export file for saving
-            import glob
-            import json
-            import os
-            
-            json_files = glob.glob("exports/jobs_export_*.json")
-            if json_files:
-                latest_file = max(json_files, key=os.path.getctime)
-                with open(latest_file, 'r') as f:
-                    results = json.load(f)
-                save_results({"jobs": results, "success": True}, args.output)
+            # Use the jobs the orchestrator already parsed; only fall back to
+            # the latest export file if no scrape was recorded
+            jobs = orchestrator.last_jobs
+            if jobs is not None:
+                save_results({"jobs": jobs, "success": True}, args.output)
                 print(f"\n💾 Results saved to: {args.output}")
+            else:
+                from agents.core.exports import find_latest_export
+                
+                latest_file = find_latest_export()
+                if latest_file and save_export_results(latest_file, args.output):
+                    print(f"\n💾 Results saved to: {args.output}")
             
     except Exception as e:
-        logger.error(f"Orchestrator search failed: {e}")
+        logger.error("Orchestrator search failed: %s", e)
         print(f"❌ Error: {e}")
     finally:
         if orchestrator:
             await orchestrator.close()
 
 
-def run_agent_search(args: argparse.Namespace) -> None:
+def load_batch_queries(input_file: str) -> List[Dict[str, Any]]:
+    """
+    Load search queries from a JSONL file.
+    
+    Each non-blank line is a JSON object with "keywords" and optional
+    "location" and "max_results" fields.
+    
+    Args:
+        input_file: Path to the JSONL file
+        
+    Returns:
+        List of query dictionaries with defaults filled in
+        
+    Raises:
+        ValueError: If a line is not valid JSON or has no keywords
+    """
+    queries = []
+    with open(input_file, 'r') as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{input_file}:{line_number}: invalid JSON: {e}") from e
+            if not isinstance(record, dict) or not record.get("keywords"):
+                raise ValueError(f"{input_file}:{line_number}: expected an object with \"keywords\"")
+            queries.append({
+                "keywords": record["keywords"],
+                "location": record.get("location", "India,Remote"),
+                "max_results": int(record.get("max_results", 50))
+            })
+    return queries
+
+
+async def run_batch_search(args: argparse.Namespace) -> None:
+    """
+    Run many orchestrator searches in one process, sharing one orchestrator.
+    
+    Queries run one after another: the agent team keeps conversation state
+    and streams to stdout, so concurrent runs on it would interleave.
+    
+    Args:
+        args: Command line arguments
+    """
+    try:
+        queries = load_batch_queries(args.input_file)
+    except (OSError, ValueError) as e:
+        print(f"❌ Error: {e}")
+        return
+    
+    if not queries:
+        print("ℹ️ No queries found in input file")
+        return
+    
+    orchestrator = None
+    output = None
+    try:
+        orchestrator = await connect_orchestrator()
+        if args.output:
+            output = open(args.output, 'wb')
+        
+        succeeded = 0
+        for i, query in enumerate(queries, 1):
+            print(f"\n🔍 [{i}/{len(queries)}] {query['keywords']} ({query['location']})")
+            print("="*60)
+            
+            result = await orchestrator.search_jobs(**query)
+            success = not result.startswith("Error:")
+            succeeded += success
+            print(f"\n{'✅' if success else '❌'} {result}")
+            
+            if output is not None:
+                record = {**query, "success": success, "result": result, "jobs": orchestrator.last_jobs}
+                output.write(encode_json_line(record))
+                output.flush()
+        
+        print(f"\n📊 Batch complete: {succeeded}/{len(queries)} searches succeeded")
+        if args.output:
+            print(f"💾 Results saved to: {args.output}")
+            
+    except Exception as e:
+        logger.error("Batch search failed: %s", e)
+        print(f"❌ Error: {e}")
+    finally:
+        if output is not None:
+            output.close()
+        if orchestrator:
+            await orchestrator.close()
+
+
+async def run_agent_search(args: argparse.Namespace) -> None:
     """
     Run a job search using the job search agent directly.
     
@@ -115,6 +305,8 @@ def run_agent_search(args: argparse.Namespace) -> None:
     print("🎯 Initializing Job Search Agent...")
     
     try:
+        from agents.job_search.agent import JobSearchAgent, JobSearchCriteria
+        
         # Create job search agent
         agent = JobSearchAgent()
         
@@ -133,8 +325,8 @@ def run_agent_search(args: argparse.Namespace) -> None:
         print(f"🏠 Remote: {'Preferred' if args.remote else 'No preference'}")
         print("\n" + "="*60)
         
-        # Execute search
-        results = agent.search_jobs(criteria)
+        # Execute search (the scraper runs as a blocking subprocess)
+        results = await asyncio.to_thread(agent.search_jobs, criteria)
         
         # Display results
         display_agent_results(results)
@@ -145,11 +337,37 @@ def run_agent_search(args: argparse.Namespace) -> None:
             print(f"\n💾 Results saved to: {args.output}")
             
     except Exception as e:
-        logger.error(f"Agent search failed: {e}")
+        logger.error("Agent search failed: %s", e)
         print(f"❌ Error: {e}")
 
 
-def run_database_search(args: argparse.Namespace) -> None:
+def get_cached_results(args: argparse.Namespace, command: str, **query: Any):
+    """
+    Look up cached results for a search command.
+    
+    Args:
+        args: Command line arguments (honours --no-cache)
+        command: Command name, so different commands never share entries
+        **query: Normalized query parameters
+        
+    Returns:
+        Tuple of (cache, key, results); cache is None when caching is disabled
+        and results is None on a miss
+    """
+    if args.no_cache:
+        return None, None, None
+    
+    from agents.core.cache import SearchResultCache
+    
+    cache = SearchResultCache()
+    key = cache.make_key(command=command, **query)
+    results = cache.get(key)
+    if results is not None:
+        print("⚡ Using cached results (run with --no-cache to refresh)")
+    return cache, key, results
+
+
+async def run_database_search(args: argparse.Namespace) -> None:
     """
     Run a job search using the database search tool.
     
@@ -159,24 +377,36 @@ def run_database_search(args: argparse.Namespace) -> None:
     print("🗄️ Searching Database...")
     
     try:
-        # Create database search tool
-        db_tool = DatabaseSearchTool()
-        
-        # Parse keywords
-        keywords = [k.strip() for k in args.keywords.split(",")]
+        keywords = args.keywords
         
         print(f"🔍 Keywords: {', '.join(keywords)}")
         print(f"📍 Location: {args.location}")
         print(f"📊 Max Results: {args.max_results}")
         print("\n" + "="*60)
         
-        # Execute search
-        results = db_tool.intelligent_search(
+        cache, cache_key, results = get_cached_results(
+            args, "database",
             keywords=keywords,
             location=args.location,
             max_results=args.max_results
         )
         
+        if results is None:
+            from agents.tools.database_search_tool import DatabaseSearchTool
+            
+            # Create database search tool
+            db_tool = DatabaseSearchTool()
+            
+            # Execute search, one concurrent query per keyword
+            results = await db_tool.intelligent_search_async(
+                keywords=keywords,
+                location=args.location,
+                max_results=args.max_results
+            )
+            
+            if cache is not None and results.get("success"):
+                cache.set(cache_key, results)
+        
         # Display results
         display_database_results(results)
         
@@ -186,11 +416,11 @@ def run_database_search(args: argparse.Namespace) -> None:
             print(f"\n💾 Results saved to: {args.output}")
             
     except Exception as e:
-        logger.error(f"Database search failed: {e}")
+        logger.error("Database search failed: %s", e)
         print(f"❌ Error: {e}")
 
 
-def run_hybrid_search(args: argparse.Namespace) -> None:
+async def run_hybrid_search(args: argparse.Namespace) -> None:
     """
     Run a job search using the hybrid search tool.
     
@@ -200,11 +430,7 @@ def run_hybrid_search(args: argparse.Namespace) -> None:
     print("🔄 Initializing Hybrid Search (Database + Live Scraping)...")
     
     try:
-        # Create hybrid search tool
-        hybrid_tool = HybridSearchTool()
-        
-        # Parse keywords
-        keywords = [k.strip() for k in args.keywords.split(",")]
+        keywords = args.keywords
         
         print(f"🔍 Keywords: {', '.join(keywords)}")
         print(f"📍 Location: {args.location}")
@@ -212,9 +438,8 @@ def run_hybrid_search(args: argparse.Namespace) -> None:
         print(f"🕷️ Include Scraping: {args.include_scraping}")
         print("\n" + "="*60)
         
-        # Create request
-        from agents.tools.hybrid_search_tool import HybridSearchRequest
-        request = HybridSearchRequest(
+        cache, cache_key, results = get_cached_results(
+            args, "hybrid",
             keywords=keywords,
             location=args.location,
             max_results=args.max_results,
@@ -223,8 +448,27 @@ def run_hybrid_search(args: argparse.Namespace) -> None:
             max_scrape_results=args.max_scrape_results
         )
         
-        # Execute search
-        results = hybrid_tool.search_jobs_intelligently(request)
+        if results is None:
+            from agents.tools.hybrid_search_tool import HybridSearchTool, HybridSearchRequest
+            
+            # Create hybrid search tool
+            hybrid_tool = HybridSearchTool()
+            
+            # Create request
+            request = HybridSearchRequest(
+                keywords=keywords,
+                location=args.location,
+                max_results=args.max_results,
+                include_scraping=args.include_scraping,
+                scrape_threshold=args.scrape_threshold,
+                max_scrape_results=args.max_scrape_results
+            )
+            
+            # Execute search
+            results = await hybrid_tool.asearch_jobs_intelligently(request)
+            
+            if cache is not None and results.get("success"):
+                cache.set(cache_key, results)
         
         # Display results
         display_hybrid_results(results)
@@ -235,10 +479,46 @@ def run_hybrid_search(args: argparse.Namespace) -> None:
             print(f"\n💾 Results saved to: {args.output}")
             
     except Exception as e:
-        logger.error(f"Hybrid search failed: {e}")
+        logger.error("Hybrid search failed: %s", e)
         print(f"❌ Error: {e}")
 
 
+async def read_input(prompt: str) -> str:
+    """
+    Read a line from stdin without blocking the event loop.
+    
+    The read runs on a daemon thread rather than the default executor, so a
+    pending input() never holds up interpreter shutdown after Ctrl+C.
+    
+    Args:
+        prompt: Prompt to display
+        
+    Returns:
+        The line entered by the user
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    
+    def _resolve(result: Optional[str], error: Optional[BaseException]) -> None:
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+    
+    def _read() -> None:
+        try:
+            line = input(prompt)
+        except BaseException as e:
+            loop.call_soon_threadsafe(_resolve, None, e)
+        else:
+            loop.call_soon_threadsafe(_resolve, line, None)
+    
+    threading.Thread(target=_read, name="cli-input", daemon=True).start()
+    return await future
+
+
 async def run_question_mode(args: argparse.Namespace) -> None:
     """
     Run in question mode with the AutoGen orchestrator.
@@ -250,13 +530,23 @@ async def run_question_mode(args: argparse.Namespace) -> None:
     print("Ask me anything about jobs, career advice, or market insights!")
     print("Type 'exit' to quit.\n")
     
+    from agents.orchestrator.daemon import OrchestratorClient
+    
     orchestrator = None
+    pending_orchestrator = None
     try:
-        orchestrator = HireAIOrchestrator()
+        orchestrator = await OrchestratorClient.connect()
+        if orchestrator is not None:
+            print("🤖 Connected to running Hire.AI orchestrator daemon")
+        else:
+            # Input is read on its own thread, so the agent team can be built
+            # on the event loop while the first question is being typed
+            print("🤖 Initializing Hire.AI AutoGen Orchestrator...")
+            pending_orchestrator = asyncio.create_task(create_local_orchestrator())
         
         while True:
             try:
-                question = input("❓ Your question: ").strip()
+                question = (await read_input("❓ Your question: ")).strip()
                 
                 if question.lower() in ['exit', 'quit', 'q']:
                     print("👋 Goodbye!")
@@ -266,26 +556,68 @@ async def run_question_mode(args: argparse.Namespace) -> None:
                     print("Please enter a question or 'exit' to quit.")
                     continue
                 
+                if orchestrator is None:
+                    try:
+                        orchestrator = await pending_orchestrator
+                    except Exception as e:
+                        logger.error("Orchestrator setup failed: %s", e)
+                        print(f"❌ Error: {e}")
+                        break
+                
                 print("\n🤔 AutoGen agents are thinking...")
                 response = await orchestrator.ask_question(question)
                 print(f"\n✅ {response}\n")
                 print("-" * 60)
                 
-            except KeyboardInterrupt:
+            except (KeyboardInterrupt, EOFError, asyncio.CancelledError):
                 print("\n👋 Goodbye!")
                 break
             except Exception as e:
-                logger.error(f"Question processing error: {e}")
+                logger.error("Question processing error: %s", e)
                 print(f"❌ Error processing question: {e}")
                 
     except Exception as e:
-        logger.error(f"Question mode failed: {e}")
+        logger.error("Question mode failed: %s", e)
         print(f"❌ Error: {e}")
     finally:
+        if orchestrator is None and pending_orchestrator is not None:
+            # Exited before the first question: keep a finished orchestrator
+            # so it gets closed, otherwise stop the setup
+            if (pending_orchestrator.done() and not pending_orchestrator.cancelled()
+                    and pending_orchestrator.exception() is None):
+                orchestrator = pending_orchestrator.result()
+            else:
+                pending_orchestrator.cancel()
         if orchestrator:
             await orchestrator.close()
 
 
+def truncate_text(value: Any, limit: int = 200) -> str:
+    """
+    Convert a value to a string once and truncate it for display.
+    
+    Args:
+        value: Value to display
+        limit: Maximum number of characters before truncating
+        
+    Returns:
+        Display string, suffixed with '...' when truncated
+    """
+    text = value if isinstance(value, str) else str(value)
+    return text if len(text) <= limit else text[:limit] + '...'
+
+
+def write_lines(lines: List[str]) -> None:
+    """
+    Write a block of display lines to stdout in a single call.
+    
+    Args:
+        lines: Lines to write, without trailing newlines
+    """
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
 def display_orchestrator_results(results: Dict[str, Any]) -> None:
     """
     Display results from orchestrator search.
@@ -302,46 +634,45 @@ def display_orchestrator_results(results: Dict[str, Any]) -> None:
     recommendations = results.get("recommendations", [])
     conversation = results.get("conversation", [])
     
-    print(f"✅ Search completed successfully!")
-    print(f"📊 Jobs found: {len(jobs)}")
+    lines = [
+        "✅ Search completed successfully!",
+        f"📊 Jobs found: {len(jobs)}"
+    ]
     
     # Display conversation summary if available
     if conversation:
-        print(f"💬 Agent conversation: {len(conversation)} messages")
+        lines.append(f"💬 Agent conversation: {len(conversation)} messages")
     
     # Display top jobs
     if jobs:
-        print("\n🎯 TOP JOB OPPORTUNITIES:")
+        lines.append("\n🎯 TOP JOB OPPORTUNITIES:")
         for i, job in enumerate(jobs[:10], 1):
-            title = job.get("title", "N/A")
-            company = job.get("company", "N/A")
-            location = job.get("location", "N/A")
-            relevance = job.get("relevance", 0)
+            get = job.get
+            title = get("title", "N/A")
+            company = get("company", "N/A")
+            location = get("location", "N/A")
+            relevance = get("relevance", 0)
             
-            print(f"{i:2d}. {title}")
-            print(f"    🏢 {company}")
-            print(f"    📍 {location}")
-            print(f"    ⭐ Relevance: {relevance:.2f}")
-            print()
+            lines.append(
+                f"{i:2d}. {title}\n"
+                f"    🏢 {company}\n"
+                f"    📍 {location}\n"
+                f"    ⭐ Relevance: {relevance:.2f}\n"
+            )
     
     # Display analysis
     if analysis:
-        print("🧪 ANALYSIS INSIGHTS:")
+        lines.append("🧪 ANALYSIS INSIGHTS:")
         for key, value in analysis.items():
-            if isinstance(value, str):
-                display_value = value[:200] + ('...' if len(value) > 200 else '')
-            else:
-                display_value = str(value)[:200] + ('...' if len(str(value)) > 200 else '')
-            print(f"📈 {key}: {display_value}")
-            print()
+            lines.append(f"📈 {key}: {truncate_text(value)}\n")
     
     # Display recommendations
     if recommendations:
-        print("💡 CAREER RECOMMENDATIONS:")
+        lines.append("💡 CAREER RECOMMENDATIONS:")
         for i, rec in enumerate(recommendations, 1):
-            display_rec = rec[:200] + ('...' if len(str(rec)) > 200 else '')
-            print(f"{i}. {display_rec}")
-            print()
+            lines.append(f"{i}. {truncate_text(rec)}\n")
+    
+    write_lines(lines)
 
 
 def display_agent_results(results: Dict[str, Any]) -> None:
@@ -358,55 +689,63 @@ def display_agent_results(results: Dict[str, Any]) -> None:
     jobs = results.get("jobs", [])
     insights = results.get("insights", {})
     
-    print(f"✅ Search completed successfully!")
-    print(f"📊 Total found: {results.get('total_found', 0)}")
-    print(f"🔍 After filtering: {results.get('filtered_count', 0)}")
-    print(f"🎯 Final results: {len(jobs)}")
+    lines = [
+        "✅ Search completed successfully!",
+        f"📊 Total found: {results.get('total_found', 0)}",
+        f"🔍 After filtering: {results.get('filtered_count', 0)}",
+        f"🎯 Final results: {len(jobs)}"
+    ]
     
     # Display top jobs
     if jobs:
-        print("\n🎯 TOP JOB OPPORTUNITIES:")
-        for i, job in enumerate(jobs[:15], 1):
-            title = job.get("title", "N/A")
-            company = job.get("company", "N/A")
-            location = job.get("location", "N/A")
-            relevance = job.get("relevance", 0)
-            rank = job.get("search_rank", i)
+        lines.append("\n🎯 TOP JOB OPPORTUNITIES:")
+        top_jobs = heapq.nlargest(15, jobs, key=lambda job: job.get("relevance", 0))
+        for i, job in enumerate(top_jobs, 1):
+            get = job.get
+            title = get("title", "N/A")
+            company = get("company", "N/A")
+            location = get("location", "N/A")
+            relevance = get("relevance", 0)
+            rank = get("search_rank", i)
             
-            print(f"{rank:2d}. {title}")
-            print(f"    🏢 {company}")
-            print(f"    📍 {location}")
-            print(f"    ⭐ Relevance: {relevance:.2f}")
+            lines.append(
+                f"{rank:2d}. {title}\n"
+                f"    🏢 {company}\n"
+                f"    📍 {location}\n"
+                f"    ⭐ Relevance: {relevance:.2f}"
+            )
             
             # Show keywords if available
-            keywords = job.get("keywords", [])
+            keywords = get("keywords", [])
             if keywords:
                 if isinstance(keywords, str):
                     keywords = [k.strip() for k in keywords.split(';')]
-                print(f"    🏷️ Skills: {', '.join(keywords[:5])}")
-            print()
+                lines.append(f"    🏷️ Skills: {', '.join(keywords[:5])}")
+            lines.append("")
     
     # Display insights
     if insights:
-        print("🧠 SEARCH INSIGHTS:")
+        lines.append("🧠 SEARCH INSIGHTS:")
         
         if "top_companies" in insights:
-            print("🏢 Top Companies:")
-            for company, count in list(insights["top_companies"].items())[:5]:
-                print(f"   • {company}: {count} jobs")
-            print()
+            lines.append("🏢 Top Companies:")
+            for company, count in islice(insights["top_companies"].items(), 5):
+                lines.append(f"   • {company}: {count} jobs")
+            lines.append("")
         
         if "popular_skills" in insights:
-            print("🛠️ Popular Skills:")
-            for skill, count in list(insights["popular_skills"].items())[:10]:
-                print(f"   • {skill}: {count} mentions")
-            print()
+            lines.append("🛠️ Popular Skills:")
+            for skill, count in islice(insights["popular_skills"].items(), 10):
+                lines.append(f"   • {skill}: {count} mentions")
+            lines.append("")
         
         if "recommendations" in insights:
-            print("💡 Recommendations:")
+            lines.append("💡 Recommendations:")
             for rec in insights["recommendations"]:
-                print(f"   • {rec}")
-            print()
+                lines.append(f"   • {rec}")
+            lines.append("")
+    
+    write_lines(lines)
 
 
 def display_database_results(results: Dict[str, Any]) -> None:
@@ -423,48 +762,54 @@ def display_database_results(results: Dict[str, Any]) -> None:
     jobs = results.get("jobs", [])
     insights = results.get("insights", {})
     
-    print(f"✅ Database search completed!")
-    print(f"📊 Total found: {results.get('total_found', 0)}")
-    print(f"🔍 Search terms: {', '.join(results.get('search_terms', []))}")
+    lines = [
+        "✅ Database search completed!",
+        f"📊 Total found: {results.get('total_found', 0)}",
+        f"🔍 Search terms: {', '.join(results.get('search_terms', []))}"
+    ]
     
     # Display top jobs
     if jobs:
-        print("\n🎯 TOP JOB OPPORTUNITIES FROM DATABASE:")
+        lines.append("\n🎯 TOP JOB OPPORTUNITIES FROM DATABASE:")
         for i, job in enumerate(jobs[:15], 1):
-            title = job.get("title", "N/A")
-            company = job.get("company", "N/A")
-            location = job.get("location", "N/A")
-            relevance = job.get("relevance_score", 0)
-            source = job.get("source", "N/A")
+            get = job.get
+            title = get("title", "N/A")
+            company = get("company", "N/A")
+            location = get("location", "N/A")
+            relevance = get("relevance_score", 0)
+            source = get("source", "N/A")
             
-            print(f"{i:2d}. {title}")
-            print(f"    🏢 {company}")
-            print(f"    📍 {location}")
-            print(f"    📡 Source: {source}")
-            print(f"    ⭐ Relevance: {relevance:.2f}")
-            print()
+            lines.append(
+                f"{i:2d}. {title}\n"
+                f"    🏢 {company}\n"
+                f"    📍 {location}\n"
+                f"    📡 Source: {source}\n"
+                f"    ⭐ Relevance: {relevance:.2f}\n"
+            )
     
     # Display insights
     if insights:
-        print("🧠 DATABASE INSIGHTS:")
+        lines.append("🧠 DATABASE INSIGHTS:")
         
         if insights.get("top_companies"):
-            print("🏢 Top Companies:")
+            lines.append("🏢 Top Companies:")
             for company, count in insights["top_companies"]:
-                print(f"   • {company}: {count} jobs")
-            print()
+                lines.append(f"   • {company}: {count} jobs")
+            lines.append("")
         
         if insights.get("top_locations"):
-            print("📍 Top Locations:")
+            lines.append("📍 Top Locations:")
             for location, count in insights["top_locations"]:
-                print(f"   • {location}: {count} jobs")
-            print()
+                lines.append(f"   • {location}: {count} jobs")
+            lines.append("")
         
         if insights.get("sources"):
-            print("📡 Job Sources:")
+            lines.append("📡 Job Sources:")
             for source, count in insights["sources"].items():
-                print(f"   • {source}: {count} jobs")
-            print()
+                lines.append(f"   • {source}: {count} jobs")
+            lines.append("")
+    
+    write_lines(lines)
 
 
 def display_hybrid_results(results: Dict[str, Any]) -> None:
@@ -482,63 +827,70 @@ def display_hybrid_results(results: Dict[str, Any]) -> None:
     insights = results.get("insights", {})
     performance = results.get("performance", {})
     
-    print(f"✅ Hybrid search completed!")
-    print(f"📊 Total found: {results.get('total_found', 0)}")
-    print(f"🗄️ Database results: {results.get('database_count', 0)}")
-    print(f"🕷️ Scraping results: {results.get('scraping_count', 0)}")
-    print(f"⚡ Duration: {performance.get('duration_seconds', 0):.2f}s")
+    lines = [
+        "✅ Hybrid search completed!",
+        f"📊 Total found: {results.get('total_found', 0)}",
+        f"🗄️ Database results: {results.get('database_count', 0)}",
+        f"🕷️ Scraping results: {results.get('scraping_count', 0)}",
+        f"⚡ Duration: {performance.get('duration_seconds', 0):.2f}s"
+    ]
     
     if results.get("scraping_triggered"):
-        print("✅ Live scraping was triggered")
+        lines.append("✅ Live scraping was triggered")
     else:
-        print("ℹ️ Live scraping was not needed")
+        lines.append("ℹ️ Live scraping was not needed")
     
     if results.get("scraping_error"):
-        print(f"⚠️ Scraping warning: {results.get('scraping_error')}")
+        lines.append(f"⚠️ Scraping warning: {results.get('scraping_error')}")
     
     # Display top jobs
     if jobs:
-        print("\n🎯 TOP JOB OPPORTUNITIES (HYBRID RESULTS):")
-        for i, job in enumerate(jobs[:15], 1):
-            title = job.get("title", "N/A")
-            company = job.get("company", "N/A")
-            location = job.get("location", "N/A")
-            relevance = job.get("relevance_score", 0)
-            source_type = job.get("source_type", "unknown")
-            source = job.get("source", "N/A")
+        lines.append("\n🎯 TOP JOB OPPORTUNITIES (HYBRID RESULTS):")
+        top_jobs = heapq.nlargest(15, jobs, key=lambda job: job.get("relevance_score", 0))
+        for i, job in enumerate(top_jobs, 1):
+            get = job.get
+            title = get("title", "N/A")
+            company = get("company", "N/A")
+            location = get("location", "N/A")
+            relevance = get("relevance_score", 0)
+            source_type = get("source_type", "unknown")
+            source = get("source", "N/A")
             
             source_icon = "🗄️" if source_type == "database" else "🕷️"
             
-            print(f"{i:2d}. {title}")
-            print(f"    🏢 {company}")
-            print(f"    📍 {location}")
-            print(f"    {source_icon} {source_type.title()}: {source}")
-            print(f"    ⭐ Relevance: {relevance:.2f}")
-            print()
+            lines.append(
+                f"{i:2d}. {title}\n"
+                f"    🏢 {company}\n"
+                f"    📍 {location}\n"
+                f"    {source_icon} {source_type.title()}: {source}\n"
+                f"    ⭐ Relevance: {relevance:.2f}\n"
+            )
     
     # Display insights
     if insights:
-        print("🧠 HYBRID SEARCH INSIGHTS:")
+        lines.append("🧠 HYBRID SEARCH INSIGHTS:")
         
-        print(f"🔍 Strategy: {insights.get('search_strategy', 'N/A')}")
+        lines.append(f"🔍 Strategy: {insights.get('search_strategy', 'N/A')}")
         
         if insights.get("source_distribution"):
-            print("📊 Source Distribution:")
+            lines.append("📊 Source Distribution:")
             for source_type, count in insights["source_distribution"].items():
                 icon = "🗄️" if source_type == "database" else "🕷️"
-                print(f"   {icon} {source_type.replace('_', ' ').title()}: {count} jobs")
-            print()
+                lines.append(f"   {icon} {source_type.replace('_', ' ').title()}: {count} jobs")
+            lines.append("")
         
         if insights.get("top_companies"):
-            print("🏢 Top Companies:")
+            lines.append("🏢 Top Companies:")
             for company, count in insights["top_companies"]:
-                print(f"   • {company}: {count} jobs")
-            print()
+                lines.append(f"   • {company}: {count} jobs")
+            lines.append("")
         
         if insights.get("recommendation"):
-            print(f"💡 Strategy Recommendation:")
-            print(f"   {insights['recommendation']}")
-            print()
+            lines.append("💡 Strategy Recommendation:")
+            lines.append(f"   {insights['recommendation']}")
+            lines.append("")
+    
+    write_lines(lines)
 
 
 def save_results(results: Dict[str, Any], output_path: str) -> None:
@@ -550,53 +902,128 @@ def save_results(results: Dict[str, Any], output_path: str) -> None:
         output_path: Path to save file
     """
     try:
-        import json
-        with open(output_path, 'w') as f:
-            json.dump(results, f, indent=2, default=str)
-        logger.info(f"Results saved to {output_path}")
+        if orjson is not None:
+            # orjson serializes datetimes and numpy values natively, so the
+            # str() fallback only runs for genuinely unknown types
+            data = orjson.dumps(
+                results,
+                default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            )
+            with open(output_path, 'wb') as f:
+                f.write(data)
+        else:
+            with open(output_path, 'w') as f:
+                json.dump(results, f, indent=2, default=str)
+        logger.info("Results saved to %s", output_path)
     except Exception as e:
-        logger.error(f"Failed to save results: {e}")
+        logger.error("Failed to save results: %s", e)
         print(f"❌ Failed to save results: {e}")
 
 
-def create_parser() -> argparse.ArgumentParser:
+def encode_json_line(record: Dict[str, Any]) -> bytes:
     """
-    Create the command line argument parser.
+    Serialize a record as one UTF-8 JSON line for JSONL output.
     
+    Args:
+        record: Record to serialize
+        
     Returns:
-        Configured ArgumentParser
+        JSON bytes terminated by a newline
     """
-    parser = argparse.ArgumentParser(
-        description="Hire.AI AutoGen Agent Job Search System",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  # Run AutoGen orchestrator search
-  python agents/cli.py orchestrator "python developer" --location "India,Remote" --max-results 30
-
-  # Run direct agent search  
-  python agents/cli.py agent "java spring boot" --location "Bangalore,Mumbai" --remote
+    if orjson is None:
+        return (json.dumps(record, default=str) + "\n").encode("utf-8")
+    
+    return orjson.dumps(
+        record,
+        default=str,
+        option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    )
 
-  # Search database only
-  python agents/cli.py database "python, django" --location "Bangalore" --max-results 25
 
-  # Hybrid search (database + scraping)
-  python agents/cli.py hybrid "react, frontend" --location "Remote" --max-results 50
+def _is_json_array_file(f) -> bool:
+    """
+    Check that an open binary file starts with '[' and ends with ']'.
+    
+    Only the edges are read, so this catches empty, truncated and non-array
+    exports without parsing the whole file. On success the file is left
+    positioned at the '[' (past any BOM or leading whitespace); otherwise
+    it is rewound.
+    """
+    raw_head = f.read(4096)
+    head = raw_head.lstrip(b'\xef\xbb\xbf \t\r\n')
+    start = len(raw_head) - len(head)
+    f.seek(0, os.SEEK_END)
+    f.seek(max(0, f.tell() - 4096))
+    tail = f.read().rstrip(b' \t\r\n')
+    
+    is_array = head.startswith(b'[') and tail.endswith(b']')
+    f.seek(start if is_array else 0)
+    return is_array
 
-  # Interactive question mode
-  python agents/cli.py question
 
-  # Search with experience filter
-  python agents/cli.py agent "frontend react" --experience senior --output results.json
-        """
-    )
+def save_export_results(export_path: str, output_path: str) -> bool:
+    """
+    Save a scraper export file in the results format.
     
-    parser.add_argument("--verbose", "-v", action="store_true", 
-                       help="Enable verbose logging")
+    An export that is a JSON array is streamed verbatim into a
+    {"jobs": ..., "success": true} wrapper, so large exports are copied rather
+    than loaded and re-serialized. Anything else is parsed and written with
+    save_results, or rejected if it isn't a job list.
     
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+    Args:
+        export_path: Path to a jobs_export_*.json file
+        output_path: Path to save file
+        
+    Returns:
+        True if the file was written
+    """
+    try:
+        with open(export_path, 'rb') as src:
+            if _is_json_array_file(src):
+                with open(output_path, 'wb') as dst:
+                    dst.write(b'{"jobs": ')
+                    shutil.copyfileobj(src, dst, 1024 * 1024)
+                    dst.write(b', "success": true}\n')
+                logger.info("Results saved to %s", output_path)
+                return True
+            
+            try:
+                jobs = json.load(src)
+            except ValueError:
+                jobs = None
+    except OSError as e:
+        logger.error("Failed to save results: %s", e)
+        print(f"❌ Failed to save results: {e}")
+        return False
     
-    # Orchestrator command
+    if not isinstance(jobs, list):
+        logger.error("Export %s is not a JSON job list", export_path)
+        print(f"❌ Failed to save results: {export_path} is not a valid jobs export")
+        return False
+    
+    save_results({"jobs": jobs, "success": True}, output_path)
+    return True
+
+
+def _csv(value: str) -> Tuple[str, ...]:
+    """
+    Parse a comma-separated argument into a tuple of non-empty, stripped items.
+    
+    Args:
+        value: Raw argument value
+        
+    Returns:
+        Tuple of items, hashable for use in cache keys
+    """
+    items = tuple(item for item in (part.strip() for part in value.split(",")) if item)
+    if not items:
+        raise argparse.ArgumentTypeError("expected at least one comma-separated value")
+    return items
+
+
+def _add_orchestrator_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Add the orchestrator subcommand."""
     orch_parser = subparsers.add_parser("orchestrator", 
                                        help="Run AutoGen orchestrator search")
     orch_parser.add_argument("keywords", 
@@ -609,8 +1036,11 @@ Examples:
                             action="store_false", help="Disable analysis")
     orch_parser.add_argument("--output", "-o", 
                             help="Output file for results")
-    
-    # Agent command
+    orch_parser.set_defaults(func=run_orchestrator_search)
+
+
+def _add_agent_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Add the agent subcommand."""
     agent_parser = subparsers.add_parser("agent", 
                                         help="Run job search agent directly")
     agent_parser.add_argument("keywords", 
@@ -626,15 +1056,21 @@ Examples:
                              help="Prefer remote jobs")
     agent_parser.add_argument("--output", "-o", 
                              help="Output file for results")
-    
-    # Question command
+    agent_parser.set_defaults(func=run_agent_search)
+
+
+def _add_question_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Add the question subcommand."""
     question_parser = subparsers.add_parser("question", 
                                            help="Interactive AutoGen question mode")
-    
-    # Database command
+    question_parser.set_defaults(func=run_question_mode)
+
+
+def _add_database_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Add the database subcommand."""
     db_parser = subparsers.add_parser("database", 
                                      help="Search jobs in database")
-    db_parser.add_argument("keywords", 
+    db_parser.add_argument("keywords", type=_csv,
                           help="Job search keywords (comma-separated)")
     db_parser.add_argument("--location", "-l", default="India,Remote", 
                           help="Search locations")
@@ -642,11 +1078,16 @@ Examples:
                           help="Maximum results")
     db_parser.add_argument("--output", "-o", 
                           help="Output file for results")
-    
-    # Hybrid command
+    db_parser.add_argument("--no-cache", action="store_true",
+                          help="Ignore cached results from identical recent searches")
+    db_parser.set_defaults(func=run_database_search)
+
+
+def _add_hybrid_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Add the hybrid subcommand."""
     hybrid_parser = subparsers.add_parser("hybrid", 
                                          help="Hybrid search (database + scraping)")
-    hybrid_parser.add_argument("keywords", 
+    hybrid_parser.add_argument("keywords", type=_csv,
                               help="Job search keywords (comma-separated)")
     hybrid_parser.add_argument("--location", "-l", default="India,Remote", 
                               help="Search locations")
@@ -661,48 +1102,172 @@ Examples:
                               help="Maximum results from scraping")
     hybrid_parser.add_argument("--output", "-o", 
                               help="Output file for results")
+    hybrid_parser.add_argument("--no-cache", action="store_true",
+                              help="Ignore cached results from identical recent searches")
+    hybrid_parser.set_defaults(func=run_hybrid_search)
+
+
+def _add_daemon_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Add the daemon subcommand."""
+    daemon_parser = subparsers.add_parser("daemon", 
+                                         help="Keep the orchestrator warm for orchestrator/question commands")
+    daemon_parser.add_argument("--socket", 
+                              help="Unix socket path (default: $HIREAI_SOCKET, $XDG_RUNTIME_DIR or a private per-user temp dir)")
+    daemon_parser.set_defaults(func=run_daemon)
+
+
+def _add_batch_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Add the batch subcommand."""
+    batch_parser = subparsers.add_parser("batch", 
+                                        help="Run many orchestrator searches from a JSONL file")
+    batch_parser.add_argument("input_file", 
+                             help="JSONL file with one {\"keywords\", \"location\", \"max_results\"} query per line")
+    batch_parser.add_argument("--output", "-o", 
+                             help="JSONL output file with one result record per query")
+    batch_parser.set_defaults(func=run_batch_search)
+
+
+# Subcommand name -> parser builder, in help display order
+SUBCOMMAND_BUILDERS = {
+    "orchestrator": _add_orchestrator_parser,
+    "agent": _add_agent_parser,
+    "question": _add_question_parser,
+    "database": _add_database_parser,
+    "hybrid": _add_hybrid_parser,
+    "batch": _add_batch_parser,
+    "daemon": _add_daemon_parser,
+}
+
+
+def _peek_command(argv: List[str]) -> Optional[str]:
+    """Return the first positional argument, which names the subcommand."""
+    for arg in argv:
+        if not arg.startswith("-"):
+            return arg
+    return None
+
+
+# Built parsers keyed by subcommand name (None = all subcommands)
+_PARSERS: Dict[Optional[str], argparse.ArgumentParser] = {}
+
+
+def create_parser(argv: Optional[List[str]] = None) -> argparse.ArgumentParser:
+    """
+    Get the command line argument parser, building it on first use.
+    
+    Args:
+        argv: Arguments that will be parsed (defaults to sys.argv[1:]). Used
+            to build only the subparser for the invoked command.
+    
+    Returns:
+        Configured ArgumentParser, shared by later calls for the same command
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    
+    command = _peek_command(argv)
+    if command not in SUBCOMMAND_BUILDERS:
+        command = None
+    
+    parser = _PARSERS.get(command)
+    if parser is None:
+        parser = _PARSERS[command] = _build_parser(command)
+    return parser
+
+
+def _build_parser(command: Optional[str]) -> argparse.ArgumentParser:
+    """
+    Build the command line argument parser.
+    
+    Args:
+        command: Subcommand to build, or None to build all of them
+    
+    Returns:
+        Configured ArgumentParser
+    """
+    parser = argparse.ArgumentParser(
+        description="Hire.AI AutoGen Agent Job Search System",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Run AutoGen orchestrator search
+  python agents/cli.py orchestrator "python developer" --location "India,Remote" --max-results 30
+
+  # Run direct agent search  
+  python agents/cli.py agent "java spring boot" --location "Bangalore,Mumbai" --remote
+
+  # Search database only
+  python agents/cli.py database "python, django" --location "Bangalore" --max-results 25
+
+  # Hybrid search (database + scraping)
+  python agents/cli.py hybrid "react, frontend" --location "Remote" --max-results 50
+
+  # Interactive question mode
+  python agents/cli.py question
+
+  # Run many orchestrator searches, one JSON query per line
+  python agents/cli.py batch queries.jsonl --output results.jsonl
+
+  # Keep the orchestrator warm for later orchestrator/question calls
+  python agents/cli.py daemon
+
+  # Search with experience filter
+  python agents/cli.py agent "frontend react" --experience senior --output results.json
+        """
+    )
+    
+    parser.add_argument("--verbose", "-v", action="store_true", 
+                       help="Enable verbose logging")
+    
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+    
+    # Only build the invoked subcommand; fall back to all of them for
+    # top-level help, a missing command or an unknown one
+    if command is not None:
+        SUBCOMMAND_BUILDERS[command](subparsers)
+    else:
+        for build in SUBCOMMAND_BUILDERS.values():
+            build(subparsers)
     
     return parser
 
 
 async def main_async() -> None:
     """Async main CLI function."""
-    parser = create_parser()
-    args = parser.parse_args()
-    
-    # Setup application
-    setup_application(args.verbose)
+    argv = sys.argv[1:]
+    parser = create_parser(argv)
+    args = parser.parse_args(argv)
     
+    # Show help before setup, so it works without an API key configured
     if not args.command:
         parser.print_help()
         return
     
+    # Setup application
+    setup_application(args.verbose)
+    
     try:
-        # Route to appropriate command
-        if args.command == "orchestrator":
-            await run_orchestrator_search(args)
-        elif args.command == "agent":
-            run_agent_search(args)
-        elif args.command == "database":
-            run_database_search(args)
-        elif args.command == "hybrid":
-            run_hybrid_search(args)
-        elif args.command == "question":
-            await run_question_mode(args)
-        else:
-            parser.print_help()
-            
+        # Each subparser sets its handler as args.func
+        await args.func(args)
+    
     except KeyboardInterrupt:
         print("\n👋 Operation cancelled by user")
     except Exception as e:
-        logger.error(f"Unexpected error: {e}", exc_info=True)
+        logger.error("Unexpected error: %s", e, exc_info=True)
         print(f"❌ Unexpected error: {e}")
         print("   Check logs for more details")
 
 
 def main() -> None:
-    """Main CLI function wrapper."""
-    asyncio.run(main_async())
+    """Main CLI function wrapper (runs on uvloop when it is installed)."""
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main_async())
+        return
+    
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        runner.run(main_async())
 
 
 if __name__ == "__main__":
@@ -0,0 +1,99 @@
+"""
+On-disk cache for job search results.
+
+This module memoizes search results keyed by a hash of the normalized
+query, so identical searches within the TTL window skip the database
+and live scraping round trips.
+"""
+
+import os
+import json
+import time
+import hashlib
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .logging_config import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "hireai"
+DEFAULT_TTL_SECONDS = 3600
+
+
+class SearchResultCache:
+    """File-backed cache of search results with a per-entry expiry."""
+
+    def __init__(self, cache_dir: Optional[str] = None, ttl_seconds: int = DEFAULT_TTL_SECONDS):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Cache directory (defaults to $HIREAI_CACHE_DIR or ~/.cache/hireai)
+            ttl_seconds: How long entries stay valid
+        """
+        self.cache_dir = Path(cache_dir or os.getenv("HIREAI_CACHE_DIR") or DEFAULT_CACHE_DIR)
+        self.ttl_seconds = ttl_seconds
+
+    @staticmethod
+    def make_key(**query: Any) -> str:
+        """
+        Build a cache key from query parameters.
+
+        List values are sorted so keyword order does not affect the key.
+
+        Returns:
+            Hex digest identifying the query
+        """
+        normalized = {
+            name: sorted(value) if isinstance(value, (list, tuple)) else value
+            for name, value in query.items()
+        }
+        payload = json.dumps(normalized, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get cached results if present and not expired.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Cached results, or None on a miss
+        """
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable cache entry {path}: {e}")
+            return None
+
+        if entry.get("expires_at", 0) < time.time():
+            return None
+        return entry.get("results")
+
+    def set(self, key: str, results: Dict[str, Any]) -> None:
+        """
+        Store results under a key. Failures are logged, never raised.
+
+        Args:
+            key: Cache key from make_key()
+            results: Results to cache (must be JSON serializable)
+        """
+        path = self._path(key)
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            entry = {"expires_at": time.time() + self.ttl_seconds, "results": results}
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entry, f, default=str)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Failed to write search cache entry: {e}")
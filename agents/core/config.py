@@ -6,15 +6,21 @@ type checking, and environment variable support.
 """
 
 import os
-from typing import Optional, Dict, Any, List
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Mapping, Tuple
 from dataclasses import dataclass, field
 from pathlib import Path
 
 from dotenv import load_dotenv
 from .exceptions import ConfigurationError
 
+_VALID_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
 
-@dataclass
+# Repository root for a source checkout (agents/core/config.py -> project root)
+_PACKAGE_ROOT = Path(__file__).resolve().parents[2]
+
+
+@dataclass(slots=True, frozen=True)
 class OpenAIConfig:
     """Configuration for OpenAI API."""
     api_key: str
@@ -31,7 +37,7 @@ class OpenAIConfig:
             )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ScraperConfig:
     """Configuration for the Go scraper integration."""
     binary_path: Path
@@ -50,7 +56,7 @@ class ScraperConfig:
             )
 
 
-@dataclass 
+@dataclass(slots=True, frozen=True)
 class AgentConfig:
     """Main configuration for all agents."""
     openai: OpenAIConfig
@@ -75,10 +81,9 @@ class AgentConfig:
     
     def __post_init__(self):
         """Validate configuration after initialization."""
-        valid_log_levels = {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
-        if self.log_level.upper() not in valid_log_levels:
+        if self.log_level.upper() not in _VALID_LOG_LEVELS:
             raise ConfigurationError(
-                f"Invalid log level: {self.log_level}. Must be one of {valid_log_levels}",
+                f"Invalid log level: {self.log_level}. Must be one of {', '.join(sorted(_VALID_LOG_LEVELS))}",
                 config_key="LOG_LEVEL"
             )
         
@@ -89,22 +94,111 @@ class AgentConfig:
             )
 
 
+# Dataclass field -> (environment variable, default, type) for each config section
+_OPENAI_ENV_FIELDS = {
+    "api_key": ("OPENAI_API_KEY", "", str),
+    "base_url": ("OPENAI_BASE_URL", "https://api.openai.com/v1", str),
+    "model": ("OPENAI_MODEL", "gpt-4o-mini", str),
+    "timeout": ("AGENT_TIMEOUT", "300", int),
+    "max_retries": ("OPENAI_MAX_RETRIES", "3", int),
+}
+
+_SCRAPER_ENV_FIELDS = {
+    "config_path": ("SCRAPER_CONFIG_PATH", "config/production.json", str),
+    "default_keywords": ("DEFAULT_KEYWORDS", "software engineer,developer,programmer", str),
+    "default_location": ("DEFAULT_LOCATION", "India,Remote", str),
+    "default_max_results": ("DEFAULT_MAX_RESULTS", "50", int),
+    "timeout": ("SCRAPER_TIMEOUT", "300", int),
+}
+
+_AGENT_ENV_FIELDS = {
+    "orchestrator_model": ("ORCHESTRATOR_MODEL", "gpt-4o-mini", str),
+    "job_search_agent_model": ("JOB_SEARCH_AGENT_MODEL", "gpt-4o-mini", str),
+    "job_analyzer_model": ("JOB_ANALYZER_MODEL", "gpt-4o-mini", str),
+    "career_advisor_model": ("CAREER_ADVISOR_MODEL", "gpt-4o-mini", str),
+    "max_agent_rounds": ("MAX_AGENT_ROUNDS", "10", int),
+    "agent_timeout": ("AGENT_TIMEOUT", "300", int),
+    "log_level": ("LOG_LEVEL", "INFO", str),
+    "log_file": ("LOG_FILE", "logs/agents.log", str),
+    "data_dir": ("DATA_DIR", "data", str),
+    "exports_dir": ("EXPORTS_DIR", "exports", str),
+}
+
+
+def _read_env_fields(fields: Dict[str, Tuple[str, str, type]], env: Mapping[str, str]) -> Dict[str, Any]:
+    """
+    Read a config section's fields from the environment.
+    
+    Args:
+        fields: Field table mapping field name to (variable, default, type)
+        env: Environment mapping (normally os.environ)
+        
+    Returns:
+        Keyword arguments for the section's dataclass
+        
+    Raises:
+        ValueError: If a value cannot be converted to its type
+    """
+    return {name: cast(env.get(var, default)) for name, (var, default, cast) in fields.items()}
+
+
+@lru_cache(maxsize=8)
+def _find_upwards(name: str, start: Path) -> Optional[Path]:
+    """
+    Find a file in a directory or its nearest parent.
+    
+    Cached per (name, start) so repeated config loads skip the stat walk;
+    reset_global_config() clears it.
+    
+    Args:
+        name: File name (or relative path) to look for
+        start: Directory to start from
+        
+    Returns:
+        Path of the first match, or None if not found
+    """
+    for parent in [start] + list(start.parents):
+        candidate = parent / name
+        if candidate.exists():
+            return candidate
+    return None
+
+
+@lru_cache(maxsize=8)
+def _find_project_root(start: Path) -> Optional[Path]:
+    """
+    Find the project root (the directory containing bin/job-scraper).
+    
+    start is used if it has the binary, else the nearest directory with a
+    go.mod. Only when neither exists does it fall back to the checkout this
+    package lives in, so running from another project keeps using that
+    project's binary and config.
+    
+    Args:
+        start: Directory to start the search from
+        
+    Returns:
+        Project root directory, or None if not found
+    """
+    if (start / "bin" / "job-scraper").exists():
+        return start
+    go_mod = _find_upwards("go.mod", start)
+    if go_mod is not None:
+        return go_mod.parent
+    if (_PACKAGE_ROOT / "bin" / "job-scraper").exists():
+        return _PACKAGE_ROOT
+    return None
+
+
 def _load_env_file(env_file: Optional[str] = None) -> None:
     """Load environment variables from .env file."""
     if env_file is None:
         env_file = ".env.agents"
     
-    env_path = Path(env_file)
-    if env_path.exists():
+    # Checks the current directory first, then its parents
+    env_path = _find_upwards(env_file, Path.cwd())
+    if env_path is not None:
         load_dotenv(env_path)
-    else:
-        # Try to find it in parent directories
-        current_dir = Path.cwd()
-        for parent in [current_dir] + list(current_dir.parents):
-            env_path = parent / env_file
-            if env_path.exists():
-                load_dotenv(env_path)
-                break
 
 
 def get_config(env_file: Optional[str] = None) -> AgentConfig:
@@ -124,58 +218,32 @@ def get_config(env_file: Optional[str] = None) -> AgentConfig:
     _load_env_file(env_file)
     
     # Get project root (where the binary should be)
-    project_root = Path.cwd()
-    if (project_root / "bin" / "job-scraper").exists():
-        binary_path = project_root / "bin" / "job-scraper"
-        base_dir = project_root
-    else:
-        # Try to find project root by looking for go.mod
-        for parent in [project_root] + list(project_root.parents):
-            if (parent / "go.mod").exists():
-                binary_path = parent / "bin" / "job-scraper"
-                base_dir = parent
-                break
-        else:
-            raise ConfigurationError(
-                "Could not find project root or scraper binary",
-                config_key="binary_path"
-            )
+    base_dir = _find_project_root(Path.cwd())
+    if base_dir is None:
+        raise ConfigurationError(
+            "Could not find project root or scraper binary",
+            config_key="binary_path"
+        )
+    binary_path = base_dir / "bin" / "job-scraper"
     
     try:
+        env = os.environ
+        
         # Create OpenAI configuration
-        openai_config = OpenAIConfig(
-            api_key=os.getenv("OPENAI_API_KEY", ""),
-            base_url=os.getenv("OPENAI_BASE_URL", "https://api.openai.com/v1"),
-            model=os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
-            timeout=int(os.getenv("AGENT_TIMEOUT", "300")),
-            max_retries=int(os.getenv("OPENAI_MAX_RETRIES", "3"))
-        )
+        openai_config = OpenAIConfig(**_read_env_fields(_OPENAI_ENV_FIELDS, env))
         
         # Create scraper configuration
         scraper_config = ScraperConfig(
             binary_path=binary_path,
             base_dir=base_dir,
-            config_path=os.getenv("SCRAPER_CONFIG_PATH", "config/production.json"),
-            default_keywords=os.getenv("DEFAULT_KEYWORDS", "software engineer,developer,programmer"),
-            default_location=os.getenv("DEFAULT_LOCATION", "India,Remote"),
-            default_max_results=int(os.getenv("DEFAULT_MAX_RESULTS", "50")),
-            timeout=int(os.getenv("SCRAPER_TIMEOUT", "300"))
+            **_read_env_fields(_SCRAPER_ENV_FIELDS, env)
         )
         
         # Create main agent configuration
         config = AgentConfig(
             openai=openai_config,
             scraper=scraper_config,
-            orchestrator_model=os.getenv("ORCHESTRATOR_MODEL", "gpt-4o-mini"),
-            job_search_agent_model=os.getenv("JOB_SEARCH_AGENT_MODEL", "gpt-4o-mini"),
-            job_analyzer_model=os.getenv("JOB_ANALYZER_MODEL", "gpt-4o-mini"),
-            career_advisor_model=os.getenv("CAREER_ADVISOR_MODEL", "gpt-4o-mini"),
-            max_agent_rounds=int(os.getenv("MAX_AGENT_ROUNDS", "10")),
-            agent_timeout=int(os.getenv("AGENT_TIMEOUT", "300")),
-            log_level=os.getenv("LOG_LEVEL", "INFO"),
-            log_file=os.getenv("LOG_FILE", "logs/agents.log"),
-            data_dir=os.getenv("DATA_DIR", "data"),
-            exports_dir=os.getenv("EXPORTS_DIR", "exports")
+            **_read_env_fields(_AGENT_ENV_FIELDS, env)
         )
         
         return config
@@ -199,6 +267,8 @@ def get_global_config() -> AgentConfig:
 
 
 def reset_global_config() -> None:
-    """Reset the global configuration (useful for testing)."""
+    """Reset the global configuration and cached path lookups (useful for testing)."""
     global _config
-    _config = None
\ No newline at end of file
+    _config = None
+    _find_upwards.cache_clear()
+    _find_project_root.cache_clear()
@@ -13,25 +13,88 @@ Based on 12-factor app principles and cloud-native best practices.
 
 import os
 import json
-import yaml
-from typing import Dict, Any, Optional, Type, TypeVar, Union, List
+from typing import TYPE_CHECKING, Callable, Dict, Any, Optional, Type, TypeVar, Union, List, Tuple
 from pathlib import Path
 from dataclasses import dataclass, field, fields
 from enum import Enum
 import hashlib
 import base64
-from cryptography.fernet import Fernet
+import functools
 import threading
-import time
-from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler
 
 from .exceptions import ConfigurationError
 from .logging_config import get_logger
 
+# yaml, cryptography and watchdog are imported where they are first used,
+# so callers that only read env-driven config don't pay for loading them
+if TYPE_CHECKING:
+    from watchdog.observers import Observer
+
 T = TypeVar('T')
 logger = get_logger(__name__)
 
+# Parsed config files: absolute path -> (st_mtime_ns, st_size, parsed data)
+_FILE_CACHE: Dict[str, Tuple[int, int, Any]] = {}
+
+_BOOL_STRINGS = {
+    'true': True, '1': True, 'yes': True, 'on': True,
+    'false': False, '0': False, 'no': False, 'off': False,
+}
+
+
+def _coerce_bool(value: str) -> bool:
+    """Convert true/false, 1/0, yes/no or on/off (any case); raise ValueError otherwise."""
+    try:
+        return _BOOL_STRINGS[value.strip().lower()]
+    except KeyError:
+        raise ValueError(f"expected a boolean (true/false, 1/0, yes/no, on/off), got {value!r}") from None
+
+
+def _coerce_int(value: str) -> Any:
+    """Convert an integer string; other strings are left as-is."""
+    try:
+        return int(value)
+    except ValueError:
+        return value
+
+
+# Config field type -> env value converter (other types stay strings)
+_ENV_COERCERS: Dict[Any, Callable[[str], Any]] = {bool: _coerce_bool, int: _coerce_int}
+
+# Environment variable -> dotted config key
+_ENV_MAPPING = {
+    'ENVIRONMENT': 'environment',
+    'DEBUG': 'debug',
+    'HOST': 'host',
+    'PORT': 'port',
+    'WORKERS': 'workers',
+    
+    # Database
+    'DATABASE_HOST': 'database.host',
+    'DATABASE_PORT': 'database.port',
+    'DATABASE_NAME': 'database.name',
+    'DATABASE_USERNAME': 'database.username',
+    'DATABASE_PASSWORD': 'database.password',
+    
+    # Redis
+    'REDIS_HOST': 'redis.host',
+    'REDIS_PORT': 'redis.port',
+    'REDIS_PASSWORD': 'redis.password',
+    
+    # Security
+    'SECRET_KEY': 'security.secret_key',
+    'JWT_SECRET': 'security.jwt_secret',
+    
+    # OpenAI
+    'OPENAI_API_KEY': 'openai_api_key',
+    'OPENAI_BASE_URL': 'openai_base_url',
+    'OPENAI_MODEL': 'openai_model',
+    
+    # Monitoring
+    'LOG_LEVEL': 'monitoring.log_level',
+    'ENABLE_METRICS': 'monitoring.enable_metrics',
+}
+
 
 class Environment(Enum):
     """Deployment environments."""
@@ -48,7 +111,7 @@ class ConfigFormat(Enum):
     ENV = "env"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DatabaseConfig:
     """Database configuration."""
     host: str = "localhost"
@@ -65,7 +128,7 @@ class DatabaseConfig:
         return f"postgresql://{self.username}:{self.password}@{self.host}:{self.port}/{self.name}?sslmode={self.ssl_mode}"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RedisConfig:
     """Redis configuration."""
     host: str = "localhost"
@@ -90,7 +153,7 @@ class RedisConfig:
         return params
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SecurityConfig:
     """Security configuration."""
     secret_key: str = ""
@@ -110,7 +173,7 @@ class SecurityConfig:
             raise ConfigurationError("SECRET_KEY must be at least 32 characters")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MonitoringConfig:
     """Monitoring and observability configuration."""
     enable_metrics: bool = True
@@ -122,7 +185,7 @@ class MonitoringConfig:
     structured_logging: bool = True
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AdvancedConfig:
     """Advanced application configuration."""
     environment: Environment = Environment.DEVELOPMENT
@@ -182,67 +245,230 @@ class AdvancedConfig:
         return self.environment == Environment.PRODUCTION
 
 
+def _deep_merge(target: Dict[str, Any], source: Dict[str, Any]) -> None:
+    """
+    Merge source into target, recursing into nested dicts.
+    
+    Every dict level of source is copied into a dict owned by target, so
+    later in-place changes to target (such as decryption) never reach the
+    cached file data that source comes from.
+    """
+    for key, value in source.items():
+        if isinstance(value, dict):
+            existing = target.get(key)
+            if not isinstance(existing, dict):
+                existing = target[key] = {}
+            _deep_merge(existing, value)
+        else:
+            target[key] = value
+
+
+# Nested config section -> (dataclass, its field names)
+_CONFIG_SECTIONS: Dict[str, Tuple[type, frozenset]] = {
+    name: (section_class, frozenset(f.name for f in fields(section_class)))
+    for name, section_class in (
+        ('database', DatabaseConfig),
+        ('redis', RedisConfig),
+        ('security', SecurityConfig),
+        ('monitoring', MonitoringConfig),
+    )
+}
+
+
+def _env_entry(env_key: str, config_key: str) -> Tuple[str, Tuple[str, ...], Optional[Callable[[str], Any]]]:
+    """Resolve an env var mapping to its key path and the target field's converter."""
+    keys = tuple(config_key.split('.'))
+    owner = AdvancedConfig if len(keys) == 1 else _CONFIG_SECTIONS[keys[0]][0]
+    field_type = next(f.type for f in fields(owner) if f.name == keys[-1])
+    return env_key, keys, _ENV_COERCERS.get(field_type)
+
+
+# (env var, config key path, converter) entries, resolved once at import
+# so each reload does no key splitting or per-value type guessing
+_ENV_TABLE = tuple(_env_entry(env_key, config_key) for env_key, config_key in _ENV_MAPPING.items())
+
+
+class _RustFernet:
+    """
+    Adapter giving rfernet's Fernet the cryptography bytes -> bytes API.
+    
+    rfernet encrypts bytes to a str token and decrypts a str token to bytes;
+    callers here always pass and receive bytes, as with cryptography.
+    """
+    
+    __slots__ = ('_fernet',)
+    
+    def __init__(self, key: str):
+        from rfernet import Fernet as RustFernet
+        self._fernet = RustFernet(key)
+    
+    def encrypt(self, data: bytes) -> bytes:
+        return self._fernet.encrypt(data).encode('ascii')
+    
+    def decrypt(self, token: Union[str, bytes]) -> bytes:
+        if isinstance(token, bytes):
+            token = token.decode('ascii')
+        return self._fernet.decrypt(token)
+
+
+@functools.lru_cache(maxsize=4)
+def _create_fernet(key: Union[str, bytes]):
+    """
+    Create a Fernet cipher for a key.
+    
+    Uses the Rust rfernet implementation when it is installed, which has far
+    less per-call overhead on small values such as API keys. Both produce
+    and accept the same tokens, and both are used through the cryptography
+    bytes -> bytes encrypt/decrypt API. Ciphers are stateless, so managers
+    using the same key share one.
+    """
+    try:
+        return _RustFernet(key.decode() if isinstance(key, bytes) else key)
+    except ImportError:
+        from cryptography.fernet import Fernet
+        return Fernet(key.encode() if isinstance(key, str) else key)
+
+
 class ConfigEncryption:
     """Handle encryption/decryption of sensitive configuration values."""
     
     def __init__(self, key: Optional[str] = None):
         if key:
-            self.fernet = Fernet(key.encode() if isinstance(key, str) else key)
+            self.fernet = _create_fernet(key)
         else:
             # Generate a key from environment or use default
             env_key = os.getenv("CONFIG_ENCRYPTION_KEY")
             if env_key:
-                self.fernet = Fernet(env_key.encode())
+                self.fernet = _create_fernet(env_key)
             else:
                 # Use a default key (not secure, only for development)
+                from cryptography.fernet import Fernet
                 default_key = Fernet.generate_key()
-                self.fernet = Fernet(default_key)
+                self.fernet = _create_fernet(default_key)
                 logger.warning("Using default encryption key - not secure for production")
+        
+        # Every load and hot reload decrypts the same tokens again. The cache
+        # lives on the instance, so a manager with a different key never
+        # sees another key's plaintext.
+        self._decrypt_token = functools.lru_cache(maxsize=256)(self._decrypt_token)
     
     def encrypt_value(self, value: str) -> str:
         """Encrypt a configuration value."""
         if not value:
             return value
         
-        encrypted = self.fernet.encrypt(value.encode())
-        return base64.b64encode(encrypted).decode()
+        # Fernet tokens are already URL-safe base64
+        return self.fernet.encrypt(value.encode()).decode('ascii')
     
     def decrypt_value(self, encrypted_value: str) -> str:
-        """Decrypt a configuration value."""
+        """
+        Decrypt a configuration value.
+        
+        Values written before tokens were stored as-is carry an extra
+        base64 layer; those are still accepted.
+        """
         if not encrypted_value:
             return encrypted_value
         
         try:
-            encrypted_bytes = base64.b64decode(encrypted_value.encode())
-            decrypted = self.fernet.decrypt(encrypted_bytes)
-            return decrypted.decode()
+            return self._decrypt_token(encrypted_value)
         except Exception as e:
             logger.warning(f"Failed to decrypt value: {e}")
             return encrypted_value
+    
+    def _decrypt_token(self, encrypted_value: str) -> str:
+        """Decrypt a token, raising on failure (memoized per instance)."""
+        token = encrypted_value.encode('ascii')
+        try:
+            decrypted = self.fernet.decrypt(token)
+        except Exception:
+            decrypted = self.fernet.decrypt(base64.b64decode(token))
+        return decrypted.decode()
 
 
-class ConfigWatcher(FileSystemEventHandler):
-    """File system watcher for configuration hot reloading."""
+class ConfigWatcher:
+    """
+    File system watcher for configuration hot reloading.
     
-    def __init__(self, config_manager: 'AdvancedConfigManager'):
-        self.config_manager = config_manager
-        self.last_modified = {}
+    Where the observer reports file closes (inotify on Linux), a save is
+    handled once, when the writer closes the file, instead of on each of
+    its write events. Other platforms fall back to modification events.
+    Atomic saves (write a temp file, rename it over the original) arrive
+    as moves.
+    
+    The first change reloads immediately. Further events within the
+    debounce window are coalesced into a single reload when it closes.
+    """
     
-    def on_modified(self, event):
-        """Handle file modification events."""
+    DEBOUNCE_SECONDS = 0.05
+    SUFFIXES = ('.json', '.yaml', '.yml', '.env')
+    
+    def __init__(self, config_manager: 'AdvancedConfigManager', close_events: bool = False):
+        """
+        Initialize the watcher.
+        
+        Args:
+            config_manager: Manager to reload on changes
+            close_events: Whether the observer emits file closed events
+        """
+        self.config_manager = config_manager
+        self.close_events = close_events
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        self._changed: set = set()
+    
+    def dispatch(self, event) -> None:
+        """
+        Handle a watchdog event (the Observer calls this for every event).
+        
+        Implemented directly rather than by subclassing a watchdog handler,
+        so watchdog is only imported once hot reloading is enabled.
+        """
         if event.is_directory:
             return
         
-        file_path = Path(event.src_path)
-        if file_path.suffix in ['.json', '.yaml', '.yml', '.env']:
-            # Debounce rapid file changes
-            current_time = time.time()
-            last_mod = self.last_modified.get(file_path, 0)
-            
-            if current_time - last_mod > 1.0:  # 1 second debounce
-                self.last_modified[file_path] = current_time
-                logger.info(f"Configuration file changed: {file_path}")
-                self.config_manager.reload_configuration()
+        if event.event_type == 'moved':
+            file_path = event.dest_path  # Renamed into place
+        elif event.event_type == 'closed' or (event.event_type == 'modified' and not self.close_events):
+            file_path = event.src_path
+        else:
+            return
+        
+        name = os.path.basename(file_path)
+        if name.endswith(self.SUFFIXES) and not name.endswith('.cache.json'):  # Skip our YAML parse cache
+            self._file_changed(file_path)
+    
+    def _file_changed(self, file_path: str) -> None:
+        with self._lock:
+            self._changed.add(file_path)
+            if self._timer is not None:
+                return
+            self._start_window()
+        self._reload()
+    
+    def _start_window(self) -> None:
+        """Suppress reloads for the debounce window (caller holds the lock)."""
+        self._timer = threading.Timer(self.DEBOUNCE_SECONDS, self._close_window)
+        self._timer.daemon = True
+        self._timer.start()
+    
+    def _close_window(self) -> None:
+        """Reload once more if files changed while reloads were suppressed."""
+        with self._lock:
+            self._timer = None
+            if not self._changed:
+                return
+            self._start_window()
+        self._reload()
+    
+    def _reload(self) -> None:
+        with self._lock:
+            changed, self._changed = self._changed, set()
+        
+        for file_path in changed:
+            logger.info(f"Configuration file changed: {file_path}")
+            _FILE_CACHE.pop(os.path.abspath(file_path), None)
+        self.config_manager.reload_configuration()
 
 
 class AdvancedConfigManager:
@@ -252,14 +478,31 @@ class AdvancedConfigManager:
         self,
         config_paths: Optional[List[str]] = None,
         encryption_key: Optional[str] = None,
-        enable_hot_reload: bool = False
+        enable_hot_reload: bool = False,
+        use_file_watcher: bool = False
     ):
+        """
+        Initialize the configuration manager.
+        
+        Args:
+            config_paths: Config files to load, in override order
+            encryption_key: Fernet key for "encrypted:" values
+            enable_hot_reload: Reload configuration when config files change
+            use_file_watcher: Detect changes with a watchdog Observer instead
+                of polling the config files with os.stat
+        """
         self.config_paths = config_paths or []
         self.encryption = ConfigEncryption(encryption_key)
         self.enable_hot_reload = enable_hot_reload
+        self.use_file_watcher = use_file_watcher
         self._config: Optional[AdvancedConfig] = None
-        self._config_lock = threading.RLock()
-        self._observer: Optional[Observer] = None
+        self._config_lock = threading.Lock()
+        self._observer: Optional['Observer'] = None
+        self._poller: Optional[threading.Thread] = None
+        self._poll_stop = threading.Event()
+        self._mtime_snapshot: Dict[str, Optional[Tuple[int, int]]] = {}
+        self._fingerprint: Optional[Tuple[Any, ...]] = None
+        self._config_dirs: set = set()
         
         # Default config paths
         if not self.config_paths:
@@ -280,74 +523,176 @@ class AdvancedConfigManager:
             return Environment.DEVELOPMENT
     
     def load_configuration(self) -> AdvancedConfig:
-        """Load configuration from all sources."""
+        """
+        Load configuration from all sources.
+        
+        If no config file's (mtime, size) and no mapped environment
+        variable changed since the last load, the existing configuration
+        is returned without re-reading, decrypting or rebuilding anything.
+        """
         with self._config_lock:
+            fingerprint = (
+                tuple(self._stat_config_files().items()),
+                tuple(os.environ.get(env_key) for env_key, _, _ in _ENV_TABLE)
+            )
+            if self._config is not None and fingerprint == self._fingerprint:
+                logger.debug("Configuration sources unchanged, keeping loaded configuration")
+                return self._config
+            
             config_data = {}
             
             # Load from files
             for config_path in self.config_paths:
+                self._config_dirs.add(os.path.dirname(config_path) or '.')
                 file_data = self._load_config_file(config_path)
-                if file_data:
-                    config_data.update(file_data)
+                if isinstance(file_data, dict):
+                    _deep_merge(config_data, file_data)
             
             # Override with environment variables
             env_data = self._load_from_environment()
-            config_data.update(env_data)
+            _deep_merge(config_data, env_data)
             
             # Decrypt sensitive values
             config_data = self._decrypt_sensitive_values(config_data)
             
             # Create configuration object
             self._config = self._create_config_object(config_data)
+            self._fingerprint = fingerprint
             
             # Setup hot reloading
-            if self.enable_hot_reload and not self._observer:
+            if self.enable_hot_reload and not (self._observer or self._poller):
                 self._setup_hot_reload()
             
             logger.info("Configuration loaded successfully")
             return self._config
     
     def _load_config_file(self, file_path: str) -> Optional[Dict[str, Any]]:
-        """Load configuration from a file."""
+        """
+        Load configuration from a file.
+        
+        Parsed contents are cached by path, modification time and size, so
+        reloads only re-parse files that changed. The returned data is the
+        cached object itself and must not be modified; load_configuration
+        merges it into fresh dicts with _deep_merge.
+        """
         path = Path(file_path)
-        if not path.exists():
+        try:
+            stat = path.stat()
+        except OSError:
             return None
         
+        cache_key = os.path.abspath(path)
+        cached = _FILE_CACHE.get(cache_key)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2]
+        
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                if path.suffix in ['.yaml', '.yml']:
-                    return yaml.safe_load(f)
-                elif path.suffix == '.json':
-                    return json.load(f)
-                elif path.suffix == '.env' or path.name.startswith('.env'):
-                    return self._parse_env_file(f)
+            if path.suffix in ['.yaml', '.yml']:
+                data = self._load_yaml_file(path, stat)
+            else:
+                with open(path, 'r', encoding='utf-8') as f:
+                    if path.suffix == '.json':
+                        data = json.load(f)
+                    elif path.suffix == '.env' or path.name.startswith('.env'):
+                        data = self._parse_env_file(f)
+                    else:
+                        return None
             
         except Exception as e:
             logger.error(f"Failed to load config file {file_path}: {e}")
             return None
+        
+        _FILE_CACHE[cache_key] = (stat.st_mtime_ns, stat.st_size, data)
+        return data
+    
+    def _load_yaml_file(self, path: Path, stat: os.stat_result) -> Any:
+        """
+        Parse a YAML configuration file.
+        
+        In production the parsed data is also written to a
+        ``<name>.yaml.cache.json`` sidecar, and later processes load that
+        with the C JSON parser. The sidecar records the YAML source's
+        mtime and size and is only used while both match exactly, so a
+        source restored with an older mtime is never shadowed by it.
+        """
+        use_sidecar = self._get_environment() == Environment.PRODUCTION
+        sidecar = path.with_name(path.name + '.cache.json')
+        
+        if use_sidecar:
+            try:
+                with open(sidecar, 'r', encoding='utf-8') as f:
+                    cached = json.load(f)
+                if (isinstance(cached, dict)
+                        and cached.get('source_mtime_ns') == stat.st_mtime_ns
+                        and cached.get('source_size') == stat.st_size
+                        and 'data' in cached):
+                    return cached['data']
+            except (OSError, ValueError):
+                pass
+        
+        import yaml
+        
+        # libyaml's C loader parses much faster; PyYAML wheels ship it on most platforms
+        loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+        with open(path, 'r', encoding='utf-8') as f:
+            data = yaml.load(f, Loader=loader)
+        
+        if use_sidecar:
+            self._write_yaml_sidecar(sidecar, data, stat)
+        return data
+    
+    def _write_yaml_sidecar(self, sidecar: Path, data: Any, stat: os.stat_result) -> None:
+        """
+        Write parsed YAML data to its JSON sidecar. Failures are logged, never raised.
+        
+        Documents that don't survive a JSON round trip unchanged (dates,
+        non-string keys) get no sidecar, so loading one never changes the
+        resulting configuration.
+        """
+        try:
+            if json.loads(json.dumps(data)) != data:
+                return
+            encoded = json.dumps({
+                'source_mtime_ns': stat.st_mtime_ns,
+                'source_size': stat.st_size,
+                'data': data
+            })
+        except (TypeError, ValueError):
+            return
+        
+        if not os.access(sidecar.parent, os.W_OK):
+            return
+        
+        tmp_path = sidecar.with_name(sidecar.name + '.tmp')
+        try:
+            tmp_path.write_text(encoded, encoding='utf-8')
+            os.replace(tmp_path, sidecar)
+        except OSError as e:
+            logger.debug(f"Failed to write config cache {sidecar}: {e}")
     
     def _parse_env_file(self, file_handle) -> Dict[str, Any]:
         """Parse environment file."""
         config = {}
         for line in file_handle:
             line = line.strip()
-            if line and not line.startswith('#'):
-                if '=' in line:
-                    key, value = line.split('=', 1)
-                    key = key.strip()
-                    value = value.strip().strip('"').strip("'")
-                    
-                    # Convert to nested structure
-                    if '.' in key:
-                        parts = key.split('.')
-                        current = config
-                        for part in parts[:-1]:
-                            if part not in current:
-                                current[part] = {}
-                            current = current[part]
-                        current[parts[-1]] = value
-                    else:
-                        config[key] = value
+            if not line or line.startswith('#'):
+                continue
+            
+            key, sep, value = line.partition('=')
+            if not sep:
+                continue
+            
+            key = key.strip()
+            value = value.strip()
+            if len(value) >= 2 and value[0] == value[-1] and value[0] in '"\'':
+                value = value[1:-1]
+            
+            # Convert to nested structure
+            *parents, leaf = key.split('.')
+            current = config
+            for part in parents:
+                current = current.setdefault(part, {})
+            current[leaf] = value
         
         return config
     
@@ -355,51 +700,18 @@ class AdvancedConfigManager:
         """Load configuration from environment variables."""
         config = {}
         
-        # Map environment variables to config structure
-        env_mapping = {
-            'ENVIRONMENT': 'environment',
-            'DEBUG': 'debug',
-            'HOST': 'host',
-            'PORT': 'port',
-            'WORKERS': 'workers',
-            
-            # Database
-            'DATABASE_HOST': 'database.host',
-            'DATABASE_PORT': 'database.port',
-            'DATABASE_NAME': 'database.name',
-            'DATABASE_USERNAME': 'database.username',
-            'DATABASE_PASSWORD': 'database.password',
-            
-            # Redis
-            'REDIS_HOST': 'redis.host',
-            'REDIS_PORT': 'redis.port',
-            'REDIS_PASSWORD': 'redis.password',
-            
-            # Security
-            'SECRET_KEY': 'security.secret_key',
-            'JWT_SECRET': 'security.jwt_secret',
-            
-            # OpenAI
-            'OPENAI_API_KEY': 'openai_api_key',
-            'OPENAI_BASE_URL': 'openai_base_url',
-            'OPENAI_MODEL': 'openai_model',
-            
-            # Monitoring
-            'LOG_LEVEL': 'monitoring.log_level',
-            'ENABLE_METRICS': 'monitoring.enable_metrics',
-        }
-        
-        for env_key, config_key in env_mapping.items():
-            value = os.getenv(env_key)
+        for env_key, keys, coerce in _ENV_TABLE:
+            value = os.environ.get(env_key)
             if value is not None:
-                # Convert types
-                if value.lower() in ['true', 'false']:
-                    value = value.lower() == 'true'
-                elif value.isdigit():
-                    value = int(value)
+                # Convert to the target field's type
+                if coerce is not None:
+                    try:
+                        value = coerce(value)
+                    except ValueError as e:
+                        logger.warning(f"Ignoring environment variable {env_key}: {e}")
+                        continue
                 
                 # Set nested value
-                keys = config_key.split('.')
                 current = config
                 for key in keys[:-1]:
                     if key not in current:
@@ -430,40 +742,39 @@ class AdvancedConfigManager:
     
     def _get_nested_value(self, data: Dict[str, Any], key: str) -> Any:
         """Get nested value from dictionary using dot notation."""
-        keys = key.split('.')
         current = data
-        for k in keys:
-            if isinstance(current, dict) and k in current:
-                current = current[k]
-            else:
+        while True:
+            head, sep, key = key.partition('.')
+            if not isinstance(current, dict) or head not in current:
                 return None
-        return current
+            current = current[head]
+            if not sep:
+                return current
     
     def _set_nested_value(self, data: Dict[str, Any], key: str, value: Any) -> None:
         """Set nested value in dictionary using dot notation."""
-        keys = key.split('.')
         current = data
-        for k in keys[:-1]:
-            if k not in current:
-                current[k] = {}
-            current = current[k]
-        current[keys[-1]] = value
+        head, sep, key = key.partition('.')
+        while sep:
+            current = current.setdefault(head, {})
+            head, sep, key = key.partition('.')
+        current[head] = value
     
     def _create_config_object(self, config_data: Dict[str, Any]) -> AdvancedConfig:
         """Create AdvancedConfig object from dictionary."""
         try:
             # Handle nested objects
-            if 'database' in config_data:
-                config_data['database'] = DatabaseConfig(**config_data['database'])
-            
-            if 'redis' in config_data:
-                config_data['redis'] = RedisConfig(**config_data['redis'])
-            
-            if 'security' in config_data:
-                config_data['security'] = SecurityConfig(**config_data['security'])
-            
-            if 'monitoring' in config_data:
-                config_data['monitoring'] = MonitoringConfig(**config_data['monitoring'])
+            for name, (section_class, known_fields) in _CONFIG_SECTIONS.items():
+                raw = config_data.get(name)
+                if isinstance(raw, dict):
+                    # A typo'd key must fail loudly rather than fall back to defaults
+                    unknown = raw.keys() - known_fields
+                    if unknown:
+                        raise ConfigurationError(
+                            f"Unknown {name} config keys: {', '.join(sorted(unknown))}",
+                            config_key=name
+                        )
+                    config_data[name] = section_class(**raw)
             
             # Handle environment enum
             if 'environment' in config_data:
@@ -477,17 +788,24 @@ class AdvancedConfigManager:
     
     def _setup_hot_reload(self) -> None:
         """Setup file watching for hot reloading."""
+        if not self.use_file_watcher:
+            self._start_poller()
+            return
+        
         try:
+            from watchdog.observers import Observer
+            
             self._observer = Observer()
-            event_handler = ConfigWatcher(self)
+            # Only watchdog's inotify backend reports file closes; importing it
+            # directly fails off Linux, so check the platform Observer by name
+            event_handler = ConfigWatcher(
+                self, close_events=type(self._observer).__name__ == 'InotifyObserver'
+            )
             
-            # Watch config directories
-            watched_dirs = set()
-            for config_path in self.config_paths:
-                config_dir = Path(config_path).parent
-                if config_dir.exists() and config_dir not in watched_dirs:
-                    self._observer.schedule(event_handler, str(config_dir), recursive=False)
-                    watched_dirs.add(config_dir)
+            # Watch config directories (collected while loading, one stat each)
+            for config_dir in self._config_dirs:
+                if os.path.isdir(config_dir):
+                    self._observer.schedule(event_handler, config_dir, recursive=False)
             
             self._observer.start()
             logger.info("Configuration hot reloading enabled")
@@ -495,6 +813,44 @@ class AdvancedConfigManager:
         except Exception as e:
             logger.error(f"Failed to setup hot reloading: {e}")
     
+    def _start_poller(self, interval: float = 2.0) -> None:
+        """
+        Poll the config files for changes on a daemon thread.
+        
+        A handful of os.stat calls every few seconds is cheaper than a
+        watchdog Observer, its event queue and platform backend.
+        
+        Args:
+            interval: Seconds between polls
+        """
+        self._poll_stop.clear()
+        self._mtime_snapshot = self._stat_config_files()
+        self._poller = threading.Thread(
+            target=self._poll_config_files, args=(interval,), name="config-poller", daemon=True
+        )
+        self._poller.start()
+        logger.info("Configuration hot reloading enabled")
+    
+    def _stat_config_files(self) -> Dict[str, Optional[Tuple[int, int]]]:
+        """Get (mtime_ns, size) for each config path, or None if it is missing."""
+        snapshot = {}
+        for config_path in self.config_paths:
+            try:
+                stat = os.stat(config_path)
+                snapshot[config_path] = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                snapshot[config_path] = None
+        return snapshot
+    
+    def _poll_config_files(self, interval: float) -> None:
+        while not self._poll_stop.wait(interval):
+            snapshot = self._stat_config_files()
+            if snapshot != self._mtime_snapshot:
+                changed = [path for path, state in snapshot.items() if state != self._mtime_snapshot.get(path)]
+                self._mtime_snapshot = snapshot
+                logger.info(f"Configuration files changed: {', '.join(changed)}")
+                self.reload_configuration()
+    
     def reload_configuration(self) -> None:
         """Reload configuration from all sources."""
         try:
@@ -517,6 +873,12 @@ class AdvancedConfigManager:
             self._observer.join()
             self._observer = None
             logger.info("Configuration hot reloading stopped")
+        
+        if self._poller:
+            self._poll_stop.set()
+            self._poller.join()
+            self._poller = None
+            logger.info("Configuration hot reloading stopped")
     
     def encrypt_sensitive_value(self, value: str) -> str:
         """Encrypt a sensitive value for storage."""
@@ -525,7 +887,7 @@ class AdvancedConfigManager:
 
 # Global configuration manager
 _config_manager: Optional[AdvancedConfigManager] = None
-_manager_lock = threading.RLock()
+_manager_lock = threading.Lock()
 
 
 def get_config_manager() -> AdvancedConfigManager:
@@ -553,44 +915,63 @@ def set_config_manager(manager: AdvancedConfigManager) -> None:
     """Set global configuration manager."""
     global _config_manager
     with _manager_lock:
-        if _config_manager and _config_manager._observer:
+        if _config_manager:
             _config_manager.stop_hot_reload()
         _config_manager = manager
 
 
 # Environment-specific configuration loaders
+# Environment -> (config paths, enable hot reload)
+_ENV_PROFILES: Dict[Environment, Tuple[Tuple[str, ...], bool]] = {
+    Environment.DEVELOPMENT: (("config/development.yaml", "config/local.yaml", ".env.development"), True),
+    Environment.STAGING: (("config/staging.yaml", ".env.staging"), False),
+    Environment.PRODUCTION: (("config/production.yaml", ".env.production"), False),
+    Environment.TESTING: (("config/testing.yaml", ".env.testing"), False),
+}
+
+
+def load_env_config(environment: Environment) -> AdvancedConfig:
+    """
+    Load configuration for an environment profile.
+    
+    Parsed config files are shared through the module-level file cache, so
+    repeated loads only re-read files that changed.
+    
+    Args:
+        environment: Development, staging, production or testing
+    
+    Returns:
+        Loaded configuration
+    
+    Raises:
+        ConfigurationError: If the environment has no profile
+    """
+    profile = _ENV_PROFILES.get(environment)
+    if profile is None:
+        raise ConfigurationError(
+            f"No configuration profile for environment: {environment!r}",
+            config_key="environment"
+        )
+    config_paths, enable_hot_reload = profile
+    manager = AdvancedConfigManager(config_paths=list(config_paths), enable_hot_reload=enable_hot_reload)
+    return manager.load_configuration()
+
+
 def load_development_config() -> AdvancedConfig:
     """Load development configuration."""
-    manager = AdvancedConfigManager(
-        config_paths=[
-            "config/development.yaml",
-            "config/local.yaml",
-            ".env.development"
-        ],
-        enable_hot_reload=True
-    )
-    return manager.load_configuration()
+    return load_env_config(Environment.DEVELOPMENT)
+
+
+def load_staging_config() -> AdvancedConfig:
+    """Load staging configuration."""
+    return load_env_config(Environment.STAGING)
 
 
 def load_production_config() -> AdvancedConfig:
     """Load production configuration."""
-    manager = AdvancedConfigManager(
-        config_paths=[
-            "config/production.yaml",
-            ".env.production"
-        ],
-        enable_hot_reload=False
-    )
-    return manager.load_configuration()
+    return load_env_config(Environment.PRODUCTION)
 
 
 def load_testing_config() -> AdvancedConfig:
     """Load testing configuration."""
-    manager = AdvancedConfigManager(
-        config_paths=[
-            "config/testing.yaml",
-            ".env.testing"
-        ],
-        enable_hot_reload=False
-    )
-    return manager.load_configuration()
\ No newline at end of file
+    return load_env_config(Environment.TESTING)
\ No newline at end of file
@@ -10,16 +10,20 @@ This module provides a lightweight dependency injection system that:
 Based on industry best practices from frameworks like Spring and .NET Core DI.
 """
 
-from typing import Any, Callable, Dict, Type, TypeVar, Optional, Union, get_type_hints
+from typing import Any, Callable, Dict, Iterable, Tuple, Type, TypeVar, Optional, Union, get_type_hints
 from abc import ABC, abstractmethod
 from enum import Enum
 import inspect
+import logging
 import threading
-from contextlib import contextmanager
-from functools import wraps
+from contextvars import ContextVar
+from functools import partial, wraps
 
 T = TypeVar('T')
 
+_EMPTY = inspect.Parameter.empty
+_MISSING = object()
+
 
 class ServiceLifetime(Enum):
     """Service lifetime scopes."""
@@ -31,6 +35,8 @@ class ServiceLifetime(Enum):
 class ServiceDescriptor:
     """Describes how a service should be created and managed."""
     
+    __slots__ = ('service_type', 'implementation', 'lifetime', 'factory', 'resolve', 'injection_plan')
+    
     def __init__(
         self,
         service_type: Type,
@@ -42,6 +48,10 @@ class ServiceDescriptor:
         self.implementation = implementation
         self.lifetime = lifetime
         self.factory = factory
+        # Set by the container at registration: returns an instance for this lifetime
+        self.resolve: Optional[Callable[[], Any]] = None
+        # Constructor injection plan for class implementations, built once
+        self.injection_plan: Optional[Tuple[Tuple[str, Any, Any], ...]] = None
 
 
 class IServiceContainer(ABC):
@@ -78,13 +88,80 @@ class IServiceContainer(ABC):
         pass
 
 
+def _resolve_ctor_plan(implementation_type: Type) -> Tuple[Tuple[str, Any, Any], ...]:
+    """
+    Build the constructor injection plan for a type.
+    
+    Constructor signatures don't change at runtime, so the container keeps
+    the plan on the service descriptor (and @injectable on the class) rather
+    than running inspect.signature and get_type_hints on every resolution.
+    
+    Args:
+        implementation_type: Class to inspect
+    
+    Returns:
+        (parameter name, type hint or None, default or Parameter.empty) for
+        each constructor parameter except self
+    """
+    parameters = inspect.signature(implementation_type.__init__).parameters
+    param_names = [name for name in parameters.keys() if name != 'self']
+    if not param_names:
+        return ()
+    
+    type_hints = get_type_hints(implementation_type.__init__)
+    return tuple(
+        (name, type_hints.get(name), parameters[name].default)
+        for name in param_names
+    )
+
+
+def _class_ctor_plan(implementation_type: Type) -> Tuple[Tuple[str, Any, Any], ...]:
+    """Get a class's plan, preferring the one @injectable stored on it."""
+    # Read it from the class itself so a subclass never picks up its
+    # parent's constructor
+    plan = implementation_type.__dict__.get('_injection_plan')
+    return _resolve_ctor_plan(implementation_type) if plan is None else plan
+
+
+class Scope:
+    """
+    A dependency injection scope with its own scoped service instances.
+    
+    The active scope is tracked in a context variable, so scopes on
+    different threads or asyncio tasks are independent of each other.
+    Each scope records its container and the scope it was entered in, so
+    scopes of different containers can be nested.
+    """
+    
+    def __init__(self, container: 'ServiceContainer'):
+        self.container = container
+        self.instances: Dict[Type, Any] = {}
+        self.parent: Optional['Scope'] = None
+        self._token = None
+    
+    def __enter__(self) -> 'ServiceContainer':
+        self.parent = _current_scope.get()
+        self._token = _current_scope.set(self)
+        return self.container
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        _current_scope.reset(self._token)
+        self._token = None
+        self.parent = None
+
+
+# Innermost active scope, shared by all containers (ContextVars are never
+# garbage collected, so there is one for the module, not one per container)
+_current_scope: ContextVar[Optional[Scope]] = ContextVar("hireai_scope", default=None)
+
+
 class ServiceContainer(IServiceContainer):
     """Implementation of dependency injection container."""
     
     def __init__(self):
         self._services: Dict[Type, ServiceDescriptor] = {}
         self._singletons: Dict[Type, Any] = {}
-        self._scoped_instances: Dict[Type, Any] = {}
+        self._scoped_instances: Dict[Type, Any] = {}  # Used outside any scope
         self._lock = threading.RLock()
     
     def register(
@@ -96,6 +173,7 @@ class ServiceContainer(IServiceContainer):
         """Register a service with the container."""
         with self._lock:
             descriptor = ServiceDescriptor(service_type, implementation, lifetime)
+            descriptor.resolve = self._make_resolver(descriptor)
             self._services[service_type] = descriptor
         return self
     
@@ -108,9 +186,23 @@ class ServiceContainer(IServiceContainer):
         """Register a service factory."""
         with self._lock:
             descriptor = ServiceDescriptor(service_type, None, lifetime, factory)
+            descriptor.resolve = self._make_resolver(descriptor)
             self._services[service_type] = descriptor
         return self
     
+    def register_many(self, descriptors: Iterable[ServiceDescriptor]) -> 'ServiceContainer':
+        """
+        Register several services at once, taking the lock a single time.
+        
+        Args:
+            descriptors: Service descriptors (use factory= for factory registrations)
+        """
+        with self._lock:
+            for descriptor in descriptors:
+                descriptor.resolve = self._make_resolver(descriptor)
+                self._services[descriptor.service_type] = descriptor
+        return self
+    
     def register_singleton(self, service_type: Type[T], implementation: Union[Type[T], T]) -> 'ServiceContainer':
         """Register a singleton service."""
         return self.register(service_type, implementation, ServiceLifetime.SINGLETON)
@@ -124,35 +216,55 @@ class ServiceContainer(IServiceContainer):
         return self.register(service_type, implementation, ServiceLifetime.SCOPED)
     
     def get_service(self, service_type: Type[T]) -> Optional[T]:
-        """Get a service instance."""
-        try:
-            return self.get_required_service(service_type)
-        except KeyError:
-            return None
+        """Get a service instance, or None if it is not registered."""
+        descriptor = self._services.get(service_type)
+        return None if descriptor is None else descriptor.resolve()
     
     def get_required_service(self, service_type: Type[T]) -> T:
-        """Get a required service instance (throws if not found)."""
-        with self._lock:
-            if service_type not in self._services:
-                raise KeyError(f"Service {service_type.__name__} is not registered")
-            
-            descriptor = self._services[service_type]
-            
-            # Handle singleton lifetime
-            if descriptor.lifetime == ServiceLifetime.SINGLETON:
-                if service_type not in self._singletons:
-                    self._singletons[service_type] = self._create_instance(descriptor)
-                return self._singletons[service_type]
-            
-            # Handle scoped lifetime
-            elif descriptor.lifetime == ServiceLifetime.SCOPED:
-                if service_type not in self._scoped_instances:
-                    self._scoped_instances[service_type] = self._create_instance(descriptor)
-                return self._scoped_instances[service_type]
-            
-            # Handle transient lifetime
-            else:
-                return self._create_instance(descriptor)
+        """
+        Get a required service instance (throws if not found).
+        
+        Lookups don't take the lock: single dict reads are atomic under the
+        GIL, and the dicts are only written while holding it. The lock is
+        only taken to create a singleton or scoped instance.
+        """
+        descriptor = self._services.get(service_type)
+        if descriptor is None:
+            raise KeyError(f"Service {service_type.__name__} is not registered")
+        return descriptor.resolve()
+    
+    def _make_resolver(self, descriptor: ServiceDescriptor) -> Callable[[], Any]:
+        """Pick the resolution function for a descriptor's lifetime once, at registration."""
+        if descriptor.factory is None and inspect.isclass(descriptor.implementation):
+            try:
+                descriptor.injection_plan = _class_ctor_plan(descriptor.implementation)
+            except NameError:
+                pass  # Forward-referenced hints; the plan is built on first resolution
+        
+        if descriptor.lifetime == ServiceLifetime.SINGLETON:
+            return partial(self._get_or_create, self._singletons, descriptor)
+        
+        if descriptor.lifetime == ServiceLifetime.SCOPED:
+            return lambda: self._get_or_create(self._active_scoped_instances(), descriptor)
+        
+        return partial(self._create_instance, descriptor)
+    
+    def _get_or_create(self, instances: Dict[Type, Any], descriptor: ServiceDescriptor) -> Any:
+        """
+        Get a cached instance, creating it under the lock on first use.
+        
+        Double-checked: the steady state is one lock-free dict read. Instances
+        are fully constructed before the single-key dict write that publishes
+        them, so other threads never see a partially built one.
+        """
+        instance = instances.get(descriptor.service_type, _MISSING)
+        if instance is _MISSING:
+            with self._lock:
+                instance = instances.get(descriptor.service_type, _MISSING)
+                if instance is _MISSING:
+                    instance = self._create_instance(descriptor)
+                    instances[descriptor.service_type] = instance
+        return instance
     
     def _create_instance(self, descriptor: ServiceDescriptor) -> Any:
         """Create an instance based on the service descriptor."""
@@ -165,45 +277,35 @@ class ServiceContainer(IServiceContainer):
             return descriptor.implementation
         
         # Create instance using constructor injection
-        return self._create_with_injection(descriptor.implementation)
+        return self._create_with_injection(descriptor)
     
-    def _create_with_injection(self, implementation_type: Type) -> Any:
+    def _create_with_injection(self, descriptor: ServiceDescriptor) -> Any:
         """Create instance with constructor dependency injection."""
+        implementation_type = descriptor.implementation
         try:
-            # Get constructor signature
-            sig = inspect.signature(implementation_type.__init__)
-            parameters = sig.parameters
-            
-            # Skip 'self' parameter
-            param_names = [name for name in parameters.keys() if name != 'self']
-            
-            if not param_names:
+            plan = descriptor.injection_plan
+            if plan is None:
+                plan = descriptor.injection_plan = _class_ctor_plan(implementation_type)
+            if not plan:
                 # No dependencies, create directly
                 return implementation_type()
             
-            # Get type hints for parameters
-            type_hints = get_type_hints(implementation_type.__init__)
-            
             # Resolve dependencies
             kwargs = {}
-            for param_name in param_names:
-                param = parameters[param_name]
-                
-                # Get parameter type
-                if param_name in type_hints:
-                    param_type = type_hints[param_name]
-                    
+            for param_name, param_type, default in plan:
+                if param_type is not None:
                     # Try to resolve dependency
-                    dependency = self.get_service(param_type)
+                    descriptor = self._services.get(param_type)
+                    dependency = None if descriptor is None else descriptor.resolve()
                     if dependency is not None:
                         kwargs[param_name] = dependency
-                    elif param.default is not inspect.Parameter.empty:
+                    elif default is not _EMPTY:
                         # Use default value if available
-                        kwargs[param_name] = param.default
+                        kwargs[param_name] = default
                     else:
                         raise ValueError(f"Cannot resolve dependency {param_type} for parameter {param_name}")
-                elif param.default is not inspect.Parameter.empty:
-                    kwargs[param_name] = param.default
+                elif default is not _EMPTY:
+                    kwargs[param_name] = default
                 else:
                     raise ValueError(f"No type hint found for parameter {param_name}")
             
@@ -212,15 +314,16 @@ class ServiceContainer(IServiceContainer):
         except Exception as e:
             raise RuntimeError(f"Failed to create instance of {implementation_type.__name__}: {str(e)}") from e
     
-    @contextmanager
-    def create_scope(self):
-        """Create a new dependency injection scope."""
-        old_scoped = self._scoped_instances.copy()
-        self._scoped_instances.clear()
-        try:
-            yield self
-        finally:
-            self._scoped_instances = old_scoped
+    def create_scope(self) -> Scope:
+        """Create a new dependency injection scope (use as a context manager)."""
+        return Scope(self)
+    
+    def _active_scoped_instances(self) -> Dict[Type, Any]:
+        """Get the scoped instances of the current scope, or the container's own outside one."""
+        scope = _current_scope.get()
+        while scope is not None and scope.container is not self:
+            scope = scope.parent
+        return self._scoped_instances if scope is None else scope.instances
     
     def clear_singletons(self):
         """Clear all singleton instances (useful for testing)."""
@@ -228,9 +331,9 @@ class ServiceContainer(IServiceContainer):
             self._singletons.clear()
     
     def clear_scoped(self):
-        """Clear all scoped instances."""
+        """Clear all scoped instances of the current scope."""
         with self._lock:
-            self._scoped_instances.clear()
+            self._active_scoped_instances().clear()
     
     def is_registered(self, service_type: Type) -> bool:
         """Check if a service type is registered."""
@@ -239,16 +342,20 @@ class ServiceContainer(IServiceContainer):
 
 # Global service container instance
 _global_container: Optional[ServiceContainer] = None
-_container_lock = threading.RLock()
+_container_lock = threading.Lock()
 
 
 def get_container() -> ServiceContainer:
     """Get the global service container."""
     global _global_container
-    with _container_lock:
-        if _global_container is None:
-            _global_container = ServiceContainer()
-        return _global_container
+    container = _global_container
+    if container is None:
+        # Double-checked: only the first call (or one after a reset) locks
+        with _container_lock:
+            if _global_container is None:
+                _global_container = ServiceContainer()
+            container = _global_container
+    return container
 
 
 def set_container(container: ServiceContainer):
@@ -267,10 +374,14 @@ def reset_container():
 
 # Decorators for dependency injection
 def injectable(cls: Type[T]) -> Type[T]:
-    """Mark a class as injectable."""
+    """Mark a class as injectable and precompute its constructor injection plan."""
     # This decorator can be used to mark classes that support DI
-    # For now, it's just a marker, but could be extended for auto-registration
+    # It could be extended for auto-registration
     cls._injectable = True
+    try:
+        cls._injection_plan = _resolve_ctor_plan(cls)
+    except NameError:
+        pass  # Forward-referenced hints; the plan is built on first resolution
     return cls
 
 
@@ -287,18 +398,23 @@ def inject_optional(service_type: Type[T]) -> Optional[T]:
 # Decorator for method injection
 def injected(func: Callable) -> Callable:
     """Decorator that performs dependency injection on method parameters."""
-    sig = inspect.signature(func)
     type_hints = get_type_hints(func)
     
+    # (parameter name, type) for each annotated parameter, computed once
+    plan = tuple(
+        (param_name, type_hints[param_name])
+        for param_name in inspect.signature(func).parameters
+        if param_name in type_hints
+    )
+    
     @wraps(func)
     def wrapper(*args, **kwargs):
         # Resolve dependencies for parameters not provided
-        container = get_container()
+        get_service = get_container().get_service
         
-        for param_name, param in sig.parameters.items():
-            if param_name not in kwargs and param_name in type_hints:
-                param_type = type_hints[param_name]
-                dependency = container.get_service(param_type)
+        for param_name, param_type in plan:
+            if param_name not in kwargs:
+                dependency = get_service(param_type)
                 if dependency is not None:
                     kwargs[param_name] = dependency
         
@@ -313,15 +429,18 @@ def configure_core_services(container: ServiceContainer):
     from .config import AgentConfig, get_config
     from .logging_config import get_logger
     
-    # Register configuration as singleton
-    container.register_singleton(AgentConfig, get_config())
-    
-    # Register logger factory
-    container.register_factory(
-        logging.Logger,
-        lambda c: get_logger("hire.ai"),
-        ServiceLifetime.SINGLETON
-    )
+    container.register_many([
+        # Configuration as singleton
+        ServiceDescriptor(AgentConfig, get_config(), ServiceLifetime.SINGLETON),
+        
+        # Logger factory
+        ServiceDescriptor(
+            logging.Logger,
+            None,
+            ServiceLifetime.SINGLETON,
+            factory=lambda c: get_logger("hire.ai")
+        ),
+    ])
 
 
 def configure_agent_services(container: ServiceContainer):
@@ -329,11 +448,13 @@ def configure_agent_services(container: ServiceContainer):
     from ..tools.scraper_tool import JobScraperTool
     from ..job_search.agent import JobSearchAgent
     
-    # Register tools
-    container.register_transient(JobScraperTool, JobScraperTool)
-    
-    # Register agents
-    container.register_scoped(JobSearchAgent, JobSearchAgent)
+    container.register_many([
+        # Tools
+        ServiceDescriptor(JobScraperTool, JobScraperTool, ServiceLifetime.TRANSIENT),
+        
+        # Agents
+        ServiceDescriptor(JobSearchAgent, JobSearchAgent, ServiceLifetime.SCOPED),
+    ])
 
 
 # Example usage and testing helpers
@@ -5,23 +5,47 @@ This module defines custom exceptions that provide better error handling
 and debugging capabilities throughout the application.
 """
 
-from typing import Optional, Any, Dict
+from types import MappingProxyType
+from typing import Optional, Any, Dict, Mapping
+
+
+def _add_present(details: Dict[str, Any], values: Dict[str, Any]) -> None:
+    """Copy the non-None entries of values into details."""
+    for key, value in values.items():
+        if value is not None:
+            details[key] = value
 
 
 class HireAIError(Exception):
-    """Base exception class for all Hire.AI related errors."""
+    """
+    Base exception class for all Hire.AI related errors.
+    
+    Details are exposed as a read-only mapping, which lets the formatted
+    message be built once and reused: tracebacks, log formatters and
+    chained errors may call str() on the same exception many times.
+    """
     
     def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
         super().__init__(message)
         self.message = message
-        self.details = details or {}
+        # Copied so later changes to the caller's dict can't go stale in __str__
+        self._details = dict(details) if details else {}
+        self._str: Optional[str] = None
+    
+    @property
+    def details(self) -> Mapping[str, Any]:
+        """Error details (read-only)."""
+        return MappingProxyType(self._details)
     
     def __str__(self) -> str:
-        base_msg = self.message
-        if self.details:
-            details_str = ", ".join(f"{k}={v}" for k, v in self.details.items())
-            return f"{base_msg} (Details: {details_str})"
-        return base_msg
+        formatted = self._str
+        if formatted is None:
+            formatted = self.message
+            if self._details:
+                details_str = ", ".join(f"{k}={v}" for k, v in self._details.items())
+                formatted = f"{formatted} (Details: {details_str})"
+            self._str = formatted
+        return formatted
 
 
 class ScrapingError(HireAIError):
@@ -29,8 +53,13 @@ class ScrapingError(HireAIError):
     
     def __init__(self, message: str, source: Optional[str] = None, 
                  error_code: Optional[str] = None, **kwargs):
-        details = {"source": source, "error_code": error_code, **kwargs}
-        super().__init__(message, {k: v for k, v in details.items() if v is not None})
+        details = {}
+        if source is not None:
+            details["source"] = source
+        if error_code is not None:
+            details["error_code"] = error_code
+        _add_present(details, kwargs)
+        super().__init__(message, details)
 
 
 class AgentError(HireAIError):
@@ -38,8 +67,13 @@ class AgentError(HireAIError):
     
     def __init__(self, message: str, agent_name: Optional[str] = None,
                  operation: Optional[str] = None, **kwargs):
-        details = {"agent_name": agent_name, "operation": operation, **kwargs}
-        super().__init__(message, {k: v for k, v in details.items() if v is not None})
+        details = {}
+        if agent_name is not None:
+            details["agent_name"] = agent_name
+        if operation is not None:
+            details["operation"] = operation
+        _add_present(details, kwargs)
+        super().__init__(message, details)
 
 
 class ConfigurationError(HireAIError):
@@ -47,8 +81,13 @@ class ConfigurationError(HireAIError):
     
     def __init__(self, message: str, config_key: Optional[str] = None,
                  config_file: Optional[str] = None, **kwargs):
-        details = {"config_key": config_key, "config_file": config_file, **kwargs}
-        super().__init__(message, {k: v for k, v in details.items() if v is not None})
+        details = {}
+        if config_key is not None:
+            details["config_key"] = config_key
+        if config_file is not None:
+            details["config_file"] = config_file
+        _add_present(details, kwargs)
+        super().__init__(message, details)
 
 
 class ToolError(HireAIError):
@@ -56,8 +95,13 @@ class ToolError(HireAIError):
     
     def __init__(self, message: str, tool_name: Optional[str] = None,
                  operation: Optional[str] = None, **kwargs):
-        details = {"tool_name": tool_name, "operation": operation, **kwargs}
-        super().__init__(message, {k: v for k, v in details.items() if v is not None})
+        details = {}
+        if tool_name is not None:
+            details["tool_name"] = tool_name
+        if operation is not None:
+            details["operation"] = operation
+        _add_present(details, kwargs)
+        super().__init__(message, details)
 
 
 class ValidationError(HireAIError):
@@ -65,8 +109,13 @@ class ValidationError(HireAIError):
     
     def __init__(self, message: str, field: Optional[str] = None,
                  value: Optional[Any] = None, **kwargs):
-        details = {"field": field, "value": value, **kwargs}
-        super().__init__(message, {k: v for k, v in details.items() if v is not None})
+        details = {}
+        if field is not None:
+            details["field"] = field
+        if value is not None:
+            details["value"] = value
+        _add_present(details, kwargs)
+        super().__init__(message, details)
 
 
 class CircuitBreakerError(HireAIError):
@@ -74,18 +123,28 @@ class CircuitBreakerError(HireAIError):
     
     def __init__(self, message: str = "Circuit breaker is open", 
                  service_name: Optional[str] = None, **kwargs):
-        details = {"service_name": service_name, **kwargs}
-        super().__init__(message, {k: v for k, v in details.items() if v is not None})
+        details = {}
+        if service_name is not None:
+            details["service_name"] = service_name
+        _add_present(details, kwargs)
+        super().__init__(message, details)
 
 
 class RetryableError(HireAIError):
     """Base class for errors that can be retried."""
     
+    # Details every retryable error starts from (copied per instance)
+    _base_details: Dict[str, Any] = {"retryable": True}
+    
     def __init__(self, message: str, retry_after: Optional[int] = None,
                  max_retries: Optional[int] = None, **kwargs):
-        details = {"retry_after": retry_after, "max_retries": max_retries, 
-                  "retryable": True, **kwargs}
-        super().__init__(message, {k: v for k, v in details.items() if v is not None})
+        details = self._base_details.copy()
+        if retry_after is not None:
+            details["retry_after"] = retry_after
+        if max_retries is not None:
+            details["max_retries"] = max_retries
+        _add_present(details, kwargs)
+        super().__init__(message, details)
 
 
 class RateLimitError(RetryableError):
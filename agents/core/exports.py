@@ -0,0 +1,37 @@
+"""
+Helpers for locating the Go scraper's export files.
+"""
+
+import os
+from typing import Optional
+
+DEFAULT_EXPORTS_DIR = "exports"
+
+
+def find_latest_export(exports_dir: str = DEFAULT_EXPORTS_DIR) -> Optional[str]:
+    """
+    Find the most recently created jobs export file.
+    
+    Scans the directory once with os.scandir, so each candidate is stat'ed
+    a single time instead of once by glob and again by the max() key.
+    
+    Args:
+        exports_dir: Directory containing jobs_export_*.json files
+    
+    Returns:
+        Path of the newest export, or None if there are none
+    """
+    latest_path = None
+    latest_ctime = -1.0
+    try:
+        with os.scandir(exports_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if not (name.startswith("jobs_export_") and name.endswith(".json")):
+                    continue
+                ctime = entry.stat().st_ctime
+                if ctime > latest_ctime:
+                    latest_ctime, latest_path = ctime, entry.path
+    except FileNotFoundError:
+        return None
+    return latest_path
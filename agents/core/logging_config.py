@@ -13,6 +13,7 @@ Based on industry best practices for observability and monitoring.
 
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -85,10 +86,18 @@ def setup_logging(
         logger.debug(f"Log file: {log_file}")
 
 
+@lru_cache(maxsize=None)
 def get_logger(name: str) -> "logger":
     """
     Get a logger instance with the specified name.
     
+    Bound loggers are immutable and share the global handler setup, so one
+    instance per name is cached and reused.
+    
+    For debug messages that are costly to build, defer the work so it is
+    skipped when DEBUG is disabled:
+    ``logger.opt(lazy=True).debug("Jobs: {}", lambda: summarize(jobs))``
+    
     Args:
         name: Logger name (typically __name__)
         
@@ -107,10 +116,13 @@ def log_function_call(func_name: str, args: dict = None, result: str = None) ->
         args: Function arguments
         result: Function result (brief description)
     """
-    args_str = ", ".join(f"{k}={v}" for k, v in (args or {}).items())
-    logger.debug(f"Function call: {func_name}({args_str})")
+    # Deferred, so nothing is formatted when DEBUG is disabled
+    logger.opt(lazy=True).debug(
+        "Function call: {}",
+        lambda: f"{func_name}({', '.join(f'{k}={v}' for k, v in (args or {}).items())})"
+    )
     if result:
-        logger.debug(f"Function result: {func_name} -> {result}")
+        logger.debug("Function result: {} -> {}", func_name, result)
 
 
 def log_error_with_context(error: Exception, context: dict = None) -> None:
@@ -127,4 +139,4 @@ def log_error_with_context(error: Exception, context: dict = None) -> None:
         context_str = f" (Context: {', '.join(context_items)})"
     
     logger.error(f"Error: {type(error).__name__}: {str(error)}{context_str}")
-    logger.debug("Full traceback:", exc_info=error)
\ No newline at end of file
+    logger.opt(exception=error).debug("Full traceback:")
\ No newline at end of file
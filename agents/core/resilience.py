@@ -13,8 +13,12 @@ Based on Microsoft Azure Architecture patterns and industry best practices.
 import asyncio
 import time
 import random
-from typing import Callable, Any, Optional, Dict, Type, Union, Awaitable
-from dataclasses import dataclass, field
+import atexit
+import threading
+import contextvars
+from concurrent.futures import Future
+from typing import Callable, Any, Optional, Dict, Type, Union, Awaitable, Literal, Hashable
+from dataclasses import dataclass, field, replace
 from enum import Enum
 from functools import wraps
 import logging
@@ -25,6 +29,13 @@ from .exceptions import (
     RateLimitError, ExternalServiceError
 )
 
+_RETRY_LOG = logging.getLogger(f"{__name__}.retry")
+_TIMEOUT_LOG = logging.getLogger(f"{__name__}.timeout")
+
+# Set at interpreter exit; sync @timeout calls then run on the caller's thread
+_timeout_shutdown = threading.Event()
+atexit.register(_timeout_shutdown.set)
+
 
 class CircuitState(Enum):
     """Circuit breaker states."""
@@ -35,13 +46,22 @@ class CircuitState(Enum):
 
 @dataclass
 class RetryConfig:
-    """Configuration for retry logic."""
+    """
+    Configuration for retry logic.
+    
+    jitter_mode selects how delays grow between attempts:
+    "decorrelated" (default) draws each delay from
+    uniform(base_delay, previous_delay * 3), "equal" is exponential backoff
+    plus up to 10% jitter, and "none" is plain exponential backoff.
+    Setting jitter=False behaves like "none".
+    """
     max_attempts: int = 3
     base_delay: float = 1.0
     max_delay: float = 60.0
     exponential_base: float = 2.0
     jitter: bool = True
     retryable_exceptions: tuple = (RetryableError, ExternalServiceError, ConnectionError)
+    jitter_mode: Literal["none", "equal", "decorrelated"] = "decorrelated"
 
 
 @dataclass
@@ -55,22 +75,30 @@ class CircuitBreakerConfig:
 
 @dataclass
 class RateLimitConfig:
-    """Configuration for rate limiting."""
-    max_calls: int = 100
+    """
+    Configuration for rate limiting.
+    
+    burst_size caps how many calls can go through at once. It used to
+    default to 10 but was never read; it now defaults to None, meaning a
+    bucket as large as max_calls, which is how every limiter behaved before.
+    """
+    max_calls: int = 100  # Tokens refilled per time_window
     time_window: float = 60.0  # seconds
-    burst_size: int = 10
+    burst_size: Optional[int] = None  # Bucket capacity; defaults to max_calls
 
 
 class CircuitBreaker:
     """Circuit breaker implementation."""
     
+    logger = logging.getLogger(f"{__name__}.CircuitBreaker")
+    
     def __init__(self, config: CircuitBreakerConfig):
         self.config = config
         self.state = CircuitState.CLOSED
         self.failure_count = 0
         self.success_count = 0
         self.last_failure_time = 0
-        self.logger = logging.getLogger(f"{__name__}.CircuitBreaker")
+        self._reset_deadline = 0.0  # time.monotonic() after which OPEN may reset
     
     def __call__(self, func: Callable) -> Callable:
         """Decorator to apply circuit breaker to a function."""
@@ -80,67 +108,70 @@ class CircuitBreaker:
             return self._sync_wrapper(func)
     
     def _sync_wrapper(self, func: Callable) -> Callable:
+        expected_exception = self.config.expected_exception
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
-            if self.state == CircuitState.OPEN:
-                if self._should_attempt_reset():
-                    self.state = CircuitState.HALF_OPEN
-                    self.success_count = 0
-                    self.logger.info("Circuit breaker entering HALF_OPEN state")
-                else:
-                    raise CircuitBreakerError(
-                        f"Circuit breaker is OPEN for {func.__name__}",
-                        service_name=func.__name__
-                    )
+            if self.state is not CircuitState.CLOSED:
+                self._before_call(func)
             
             try:
                 result = func(*args, **kwargs)
-                self._on_success()
-                return result
-            except self.config.expected_exception as e:
+            except expected_exception:
                 self._on_failure()
                 raise
+            
+            self._on_success()
+            return result
         
         return wrapper
     
     def _async_wrapper(self, func: Callable) -> Callable:
+        expected_exception = self.config.expected_exception
+        
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            if self.state == CircuitState.OPEN:
-                if self._should_attempt_reset():
-                    self.state = CircuitState.HALF_OPEN
-                    self.success_count = 0
-                    self.logger.info("Circuit breaker entering HALF_OPEN state")
-                else:
-                    raise CircuitBreakerError(
-                        f"Circuit breaker is OPEN for {func.__name__}",
-                        service_name=func.__name__
-                    )
+            if self.state is not CircuitState.CLOSED:
+                self._before_call(func)
             
             try:
                 result = await func(*args, **kwargs)
-                self._on_success()
-                return result
-            except self.config.expected_exception as e:
+            except expected_exception:
                 self._on_failure()
                 raise
+            
+            self._on_success()
+            return result
         
         return wrapper
     
+    def _before_call(self, func: Callable):
+        """Leave OPEN once the recovery timeout has passed, otherwise reject the call."""
+        if self.state is CircuitState.OPEN:
+            if self._should_attempt_reset():
+                self.state = CircuitState.HALF_OPEN
+                self.success_count = 0
+                self.logger.info("Circuit breaker entering HALF_OPEN state")
+            else:
+                raise CircuitBreakerError(
+                    f"Circuit breaker is OPEN for {func.__name__}",
+                    service_name=func.__name__
+                )
+    
     def _should_attempt_reset(self) -> bool:
         """Check if circuit breaker should attempt to reset."""
-        return (time.time() - self.last_failure_time) >= self.config.recovery_timeout
+        return time.monotonic() >= self._reset_deadline
     
     def _on_success(self):
         """Handle successful execution."""
-        if self.state == CircuitState.HALF_OPEN:
+        if self.state is CircuitState.CLOSED:
+            self.failure_count = 0
+        elif self.state is CircuitState.HALF_OPEN:
             self.success_count += 1
             if self.success_count >= self.config.success_threshold:
                 self.state = CircuitState.CLOSED
                 self.failure_count = 0
                 self.logger.info("Circuit breaker reset to CLOSED state")
-        elif self.state == CircuitState.CLOSED:
-            self.failure_count = 0
     
     def _on_failure(self):
         """Handle failed execution."""
@@ -148,42 +179,74 @@ class CircuitBreaker:
         self.last_failure_time = time.time()
         
         if self.state == CircuitState.HALF_OPEN:
-            self.state = CircuitState.OPEN
+            self._open()
             self.logger.warning("Circuit breaker opened from HALF_OPEN state")
         elif (self.state == CircuitState.CLOSED and 
               self.failure_count >= self.config.failure_threshold):
-            self.state = CircuitState.OPEN
+            self._open()
             self.logger.warning(f"Circuit breaker opened after {self.failure_count} failures")
+    
+    def _open(self):
+        """Trip to OPEN, fixing the reset deadline once instead of per rejected call."""
+        self.state = CircuitState.OPEN
+        self._reset_deadline = time.monotonic() + self.config.recovery_timeout
 
 
 class RateLimiter:
-    """Token bucket rate limiter."""
+    """
+    Token bucket rate limiter.
+    
+    The bucket holds up to burst_size tokens and refills at max_calls per
+    time_window. Safe to share between threads. Tokens are counted in
+    integer thousandths and refilled from time.monotonic_ns(), so refills
+    need no float math and are unaffected by wall-clock adjustments.
+    """
+    
+    logger = logging.getLogger(f"{__name__}.RateLimiter")
     
     def __init__(self, config: RateLimitConfig):
         self.config = config
-        self.tokens = config.max_calls
-        self.last_refill = time.time()
-        self.logger = logging.getLogger(f"{__name__}.RateLimiter")
+        self._rate = config.max_calls * 1000  # millitokens per window
+        self._capacity = (config.burst_size or config.max_calls) * 1000
+        self._window_ns = max(1, int(config.time_window * 1_000_000_000))
+        self._millitokens = self._capacity
+        self._last_refill_ns = time.monotonic_ns()
+        self._lock = threading.Lock()
+    
+    @property
+    def tokens(self) -> float:
+        """Tokens available as of the last refill."""
+        return self._millitokens / 1000
     
     def acquire(self, tokens: int = 1) -> bool:
         """Acquire tokens from the bucket."""
-        self._refill()
+        needed = int(tokens * 1000)
+        with self._lock:
+            self._refill(time.monotonic_ns())
+            
+            if self._millitokens >= needed:
+                self._millitokens -= needed
+                return True
+            return False
+    
+    def _refill(self, now_ns: int):
+        """Refill tokens based on elapsed time (caller holds the lock)."""
+        elapsed = now_ns - self._last_refill_ns
         
-        if self.tokens >= tokens:
-            self.tokens -= tokens
-            return True
-        return False
-    
-    def _refill(self):
-        """Refill tokens based on elapsed time."""
-        now = time.time()
-        elapsed = now - self.last_refill
+        # Calculate tokens to add, then advance the clock only by the time
+        # those tokens account for so sub-millitoken remainders carry over
+        added = elapsed * self._rate // self._window_ns
+        if added <= 0:
+            return
         
-        if elapsed > 0:
-            # Calculate tokens to add
-            tokens_to_add = (elapsed / self.config.time_window) * self.config.max_calls
-            self.tokens = min(self.config.max_calls, self.tokens + tokens_to_add)
-            self.last_refill = now
+        tokens = self._millitokens + added
+        if tokens >= self._capacity:
+            # Bucket is full; idle time beyond this point earns nothing
+            self._millitokens = self._capacity
+            self._last_refill_ns = now_ns
+        else:
+            self._millitokens = tokens
+            self._last_refill_ns += added * self._window_ns // self._rate
     
     def __call__(self, func: Callable) -> Callable:
         """Decorator to apply rate limiting to a function."""
@@ -199,12 +262,65 @@ class RateLimiter:
         return wrapper
 
 
+class ShardedRateLimiter:
+    """
+    Rate limiter striped across independent token buckets by key.
+    
+    Each shard gets an equal share of the configured rate and burst, so the
+    shards together allow about what a single RateLimiter would, while
+    callers with different keys (users, services) rarely wait on the same
+    lock.
+    """
+    
+    def __init__(self, config: RateLimitConfig, shards: int = 16):
+        """
+        Initialize the sharded limiter.
+        
+        Args:
+            config: Overall rate limit, divided evenly between shards
+            shards: Number of buckets (a power of two, at most the rate and burst)
+        
+        Raises:
+            ValueError: If shards isn't a power of two, or the limit is too
+                small to give every shard at least one call
+        """
+        if shards <= 0 or shards & (shards - 1):
+            raise ValueError(f"shards must be a positive power of two, got {shards}")
+        
+        burst_size = config.burst_size or config.max_calls
+        if min(config.max_calls, burst_size) < shards:
+            raise ValueError(
+                f"max_calls ({config.max_calls}) and burst_size ({burst_size}) must be at least "
+                f"shards ({shards}); otherwise the shards together exceed the limit"
+            )
+        
+        self.config = config
+        shard_config = replace(
+            config,
+            max_calls=config.max_calls // shards,
+            burst_size=burst_size // shards
+        )
+        self._mask = shards - 1
+        self._shards = [RateLimiter(shard_config) for _ in range(shards)]
+    
+    def acquire(self, key: Hashable, tokens: int = 1) -> bool:
+        """Acquire tokens from the bucket that owns key."""
+        return self._shards[hash(key) & self._mask].acquire(tokens)
+
+
 def retry_with_backoff(config: RetryConfig = None):
-    """Decorator for retry logic with exponential backoff."""
+    """
+    Decorator for retry logic with exponential backoff.
+    
+    With max_attempts=1 there is nothing to retry, so the function is
+    returned unwrapped.
+    """
     if config is None:
         config = RetryConfig()
     
     def decorator(func: Callable) -> Callable:
+        if config.max_attempts == 1:
+            return func
         if asyncio.iscoroutinefunction(func):
             return _async_retry_wrapper(func, config)
         else:
@@ -214,27 +330,35 @@ def retry_with_backoff(config: RetryConfig = None):
 
 
 def _sync_retry_wrapper(func: Callable, config: RetryConfig) -> Callable:
+    decorrelated = config.jitter and config.jitter_mode == "decorrelated"
+    retryable = tuple(config.retryable_exceptions)
+    last_attempt = config.max_attempts - 1
+    
     @wraps(func)
     def wrapper(*args, **kwargs):
-        logger = logging.getLogger(f"{__name__}.retry")
         last_exception = None
+        prev_delay = config.base_delay
         
         for attempt in range(config.max_attempts):
             try:
                 return func(*args, **kwargs)
-            except config.retryable_exceptions as e:
+            except retryable as e:
                 last_exception = e
                 
-                if attempt == config.max_attempts - 1:
-                    logger.error(f"Final retry attempt failed for {func.__name__}: {e}")
+                if attempt == last_attempt:
+                    _RETRY_LOG.error(f"Final retry attempt failed for {func.__name__}: {e}")
                     raise
                 
-                delay = _calculate_delay(attempt, config)
-                logger.info(f"Retry {attempt + 1}/{config.max_attempts} for {func.__name__} in {delay:.2f}s")
+                if decorrelated:
+                    prev_delay = delay = min(config.max_delay, random.uniform(config.base_delay, prev_delay * 3.0))
+                else:
+                    delay = _calculate_delay(attempt, config)
+                if _RETRY_LOG.isEnabledFor(logging.INFO):
+                    _RETRY_LOG.info(f"Retry {attempt + 1}/{config.max_attempts} for {func.__name__} in {delay:.2f}s")
                 time.sleep(delay)
             except Exception as e:
                 # Non-retryable exception
-                logger.error(f"Non-retryable error in {func.__name__}: {e}")
+                _RETRY_LOG.error(f"Non-retryable error in {func.__name__}: {e}")
                 raise
         
         # This should never be reached
@@ -244,27 +368,35 @@ def _sync_retry_wrapper(func: Callable, config: RetryConfig) -> Callable:
 
 
 def _async_retry_wrapper(func: Callable, config: RetryConfig) -> Callable:
+    decorrelated = config.jitter and config.jitter_mode == "decorrelated"
+    retryable = tuple(config.retryable_exceptions)
+    last_attempt = config.max_attempts - 1
+    
     @wraps(func)
     async def wrapper(*args, **kwargs):
-        logger = logging.getLogger(f"{__name__}.retry")
         last_exception = None
+        prev_delay = config.base_delay
         
         for attempt in range(config.max_attempts):
             try:
                 return await func(*args, **kwargs)
-            except config.retryable_exceptions as e:
+            except retryable as e:
                 last_exception = e
                 
-                if attempt == config.max_attempts - 1:
-                    logger.error(f"Final retry attempt failed for {func.__name__}: {e}")
+                if attempt == last_attempt:
+                    _RETRY_LOG.error(f"Final retry attempt failed for {func.__name__}: {e}")
                     raise
                 
-                delay = _calculate_delay(attempt, config)
-                logger.info(f"Retry {attempt + 1}/{config.max_attempts} for {func.__name__} in {delay:.2f}s")
+                if decorrelated:
+                    prev_delay = delay = min(config.max_delay, random.uniform(config.base_delay, prev_delay * 3.0))
+                else:
+                    delay = _calculate_delay(attempt, config)
+                if _RETRY_LOG.isEnabledFor(logging.INFO):
+                    _RETRY_LOG.info(f"Retry {attempt + 1}/{config.max_attempts} for {func.__name__} in {delay:.2f}s")
                 await asyncio.sleep(delay)
             except Exception as e:
                 # Non-retryable exception
-                logger.error(f"Non-retryable error in {func.__name__}: {e}")
+                _RETRY_LOG.error(f"Non-retryable error in {func.__name__}: {e}")
                 raise
         
         # This should never be reached
@@ -274,11 +406,11 @@ def _async_retry_wrapper(func: Callable, config: RetryConfig) -> Callable:
 
 
 def _calculate_delay(attempt: int, config: RetryConfig) -> float:
-    """Calculate delay for retry attempt."""
+    """Calculate delay for retry attempt ("equal" and "none" jitter modes)."""
     delay = config.base_delay * (config.exponential_base ** attempt)
     delay = min(delay, config.max_delay)
     
-    if config.jitter:
+    if config.jitter and config.jitter_mode != "none":
         # Add jitter to prevent thundering herd
         jitter = random.uniform(0, delay * 0.1)
         delay += jitter
@@ -297,21 +429,54 @@ def timeout(seconds: float):
     return decorator
 
 
+def _submit_daemon(func: Callable, *args, **kwargs) -> Future:
+    """
+    Run func on a new daemon thread with the caller's contextvars.
+    
+    Daemon threads don't hold up interpreter exit, unlike ThreadPoolExecutor
+    workers, which are joined at shutdown.
+    """
+    future = Future()
+    context = contextvars.copy_context()
+    
+    def run():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            result = context.run(func, *args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+        else:
+            future.set_result(result)
+    
+    threading.Thread(target=run, name=f"hireai-timeout-{func.__name__}", daemon=True).start()
+    return future
+
+
 def _sync_timeout_wrapper(func: Callable, timeout_seconds: float) -> Callable:
     @wraps(func)
     def wrapper(*args, **kwargs):
-        # For sync functions, we can't easily implement timeout without threading
-        # This is a simplified version - consider using concurrent.futures for real timeout
-        start_time = time.time()
-        result = func(*args, **kwargs)
-        elapsed = time.time() - start_time
+        if _timeout_shutdown.is_set():
+            return func(*args, **kwargs)
         
-        if elapsed > timeout_seconds:
-            logging.getLogger(f"{__name__}.timeout").warning(
-                f"{func.__name__} took {elapsed:.2f}s (timeout: {timeout_seconds}s)"
+        # Run on a daemon thread so the caller can stop waiting. Python threads
+        # can't be killed, so a timed-out call is leaked: it keeps running
+        # until it returns or the process exits. Prefer bounding the work
+        # itself (e.g. subprocess.run(timeout=...)) where that is possible.
+        future = _submit_daemon(func, *args, **kwargs)
+        try:
+            return future.result(timeout=timeout_seconds)
+        except TimeoutError:
+            if future.done():
+                raise  # Raised by func itself
+            _TIMEOUT_LOG.warning(
+                f"{func.__name__} timed out after {timeout_seconds}s; "
+                "the call is left running in the background"
+            )
+            raise AgentTimeoutError(
+                f"{func.__name__} timed out after {timeout_seconds} seconds",
+                timeout_duration=int(timeout_seconds)
             )
-        
-        return result
     
     return wrapper
 
@@ -320,8 +485,11 @@ def _async_timeout_wrapper(func: Callable, timeout_seconds: float) -> Callable:
     @wraps(func)
     async def wrapper(*args, **kwargs):
         try:
-            return await asyncio.wait_for(func(*args, **kwargs), timeout=timeout_seconds)
-        except asyncio.TimeoutError:
+            async with asyncio.timeout(timeout_seconds) as deadline:
+                return await func(*args, **kwargs)
+        except TimeoutError:
+            if not deadline.expired():
+                raise  # Raised by func itself
             raise AgentTimeoutError(
                 f"{func.__name__} timed out after {timeout_seconds} seconds",
                 timeout_duration=int(timeout_seconds)
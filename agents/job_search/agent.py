@@ -5,11 +5,83 @@ Works with the Go scraper tool to find and analyze job opportunities
 
 import json
 import os
+import re
+from collections import Counter
+from operator import itemgetter
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
 from loguru import logger
 from agents.tools.scraper_tool import JobScraperTool
 
+# Optional: C Aho-Corasick automaton for the skill scan
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Entries kept in each ranked insights breakdown
+TOP_INSIGHTS = 10
+
+# Skills counted in search insights, matched as substrings of title + description
+SKILL_KEYWORDS = (
+    "python", "java", "javascript", "react", "node", "angular", "vue",
+    "docker", "kubernetes", "aws", "azure", "gcp", "sql", "mongodb",
+    "machine learning", "ai", "data science", "devops", "microservices"
+)
+
+
+def _build_skill_automaton():
+    """Build the skill automaton once at import, or None without pyahocorasick."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for skill in SKILL_KEYWORDS:
+        automaton.add_word(skill, skill)
+    automaton.make_automaton()
+    return automaton
+
+
+_SKILL_AUTOMATON = _build_skill_automaton()
+
+# Whole words used by the experience and remote filters
+_WORD_RE = re.compile(r"\w+")
+_SENIOR_WORDS = frozenset({"senior", "lead", "principal"})
+_JUNIOR_WORDS = frozenset({"junior", "intern", "entry"})
+_REMOTE_WORDS = frozenset({"remote", "wfh"})
+
+# Private keys holding lowercased copies of job fields during a search
+_LOWERED_KEYS = {
+    "title": "_title_l",
+    "description": "_desc_l",
+    "company": "_company_l",
+    "location": "_location_l",
+}
+
+
+def _lowered(job: Dict, field: str) -> str:
+    """Get a job field lowercased, reusing the copy cached by search_jobs if present."""
+    cached = job.get(_LOWERED_KEYS[field])
+    return cached if cached is not None else job.get(field, "").lower()
+
+
+def _find_skills(text: str) -> List[str]:
+    """
+    Find the skills mentioned in a lowercased text.
+    
+    With pyahocorasick installed this is a single pass over the text no matter
+    how many skills there are; otherwise each skill is a substring check.
+    
+    Args:
+        text: Lowercased job text
+    
+    Returns:
+        Distinct matching skills, in SKILL_KEYWORDS order
+    """
+    if _SKILL_AUTOMATON is not None:
+        found = {skill for _, skill in _SKILL_AUTOMATON.iter(text)}
+        return [skill for skill in SKILL_KEYWORDS if skill in found]
+    return [skill for skill in SKILL_KEYWORDS if skill in text]
+
 
 @dataclass
 class JobSearchCriteria:
@@ -65,14 +137,24 @@ class JobSearchAgent:
             
             jobs = scrape_result.get("jobs", [])
             
-            # Apply additional filtering based on criteria
-            filtered_jobs = self._filter_jobs(jobs, criteria)
+            # Lowercase the matched fields once for filtering, ranking and insights
+            for job in jobs:
+                for field, key in _LOWERED_KEYS.items():
+                    job[key] = job.get(field, "").lower()
             
-            # Rank jobs by relevance
-            ranked_jobs = self._rank_jobs(filtered_jobs, criteria)
-            
-            # Generate insights
-            insights = self._generate_insights(ranked_jobs, criteria)
+            try:
+                # Apply additional filtering based on criteria
+                filtered_jobs = self._filter_jobs(jobs, criteria)
+                
+                # Rank jobs by relevance
+                ranked_jobs = self._rank_jobs(filtered_jobs, criteria)
+                
+                # Generate insights
+                insights = self._generate_insights(ranked_jobs, criteria)
+            finally:
+                for job in jobs:
+                    for key in _LOWERED_KEYS.values():
+                        job.pop(key, None)
             
             result = {
                 "success": True,
@@ -96,48 +178,41 @@ class JobSearchAgent:
     
     def _filter_jobs(self, jobs: List[Dict], criteria: JobSearchCriteria) -> List[Dict]:
         """Apply additional filtering to job results."""
-        filtered = []
-        
-        for job in jobs:
-            # Basic filtering logic
-            if self._job_matches_criteria(job, criteria):
-                filtered.append(job)
+        # Nothing to filter on, so skip the per-job checks entirely
+        if not (criteria.experience_level or criteria.remote_preference):
+            return list(jobs)
         
-        return filtered
+        matches_criteria = self._job_matches_criteria
+        return [job for job in jobs if matches_criteria(job, criteria)]
     
     def _job_matches_criteria(self, job: Dict, criteria: JobSearchCriteria) -> bool:
         """Check if a job matches the search criteria."""
-        title = job.get("title", "").lower()
-        description = job.get("description", "").lower()
-        location = job.get("location", "").lower()
-        
-        # Experience level filtering
+        # Experience level filtering (whole words, so "Internal Tools" or
+        # "Sentry" titles aren't mistaken for intern/entry roles)
         if criteria.experience_level:
             exp_level = criteria.experience_level.lower()
-            if exp_level == "junior" and any(word in title for word in ["senior", "lead", "principal"]):
-                return False
-            elif exp_level == "senior" and any(word in title for word in ["junior", "intern", "entry"]):
+            excluded = {"junior": _SENIOR_WORDS, "senior": _JUNIOR_WORDS}.get(exp_level)
+            if excluded and not excluded.isdisjoint(_WORD_RE.findall(_lowered(job, "title"))):
                 return False
         
         # Remote preference
         if criteria.remote_preference:
-            if not any(word in location for word in ["remote", "work from home", "wfh"]):
+            location = _lowered(job, "location")
+            if _REMOTE_WORDS.isdisjoint(_WORD_RE.findall(location)) and "work from home" not in location:
                 return False
         
         return True
     
     def _rank_jobs(self, jobs: List[Dict], criteria: JobSearchCriteria) -> List[Dict]:
         """Rank jobs by relevance to search criteria."""
-        keywords = criteria.keywords.lower().split(",")
-        keywords = [k.strip() for k in keywords]
+        keywords = [k.strip() for k in criteria.keywords.lower().split(",")]
+        calculate_relevance = self._calculate_relevance
         
         for job in jobs:
-            relevance_score = self._calculate_relevance(job, keywords)
-            job["relevance"] = relevance_score
-            job["search_rank"] = 0  # Will be set after sorting
+            job["relevance"] = calculate_relevance(job, keywords)
         
         # Sort by relevance score
-        sorted_jobs = sorted(jobs, key=lambda x: x.get("relevance", 0), reverse=True)
+        sorted_jobs = sorted(jobs, key=itemgetter("relevance"), reverse=True)
         
         # Set rank
         for i, job in enumerate(sorted_jobs):
@@ -147,12 +222,14 @@ class JobSearchAgent:
     
     def _calculate_relevance(self, job: Dict, keywords: List[str]) -> float:
         """Calculate relevance score for a job."""
-        title = job.get("title", "").lower()
-        description = job.get("description", "").lower()
-        company = job.get("company", "").lower()
+        title = _lowered(job, "title")
+        description = _lowered(job, "description")
+        company = _lowered(job, "company")
         
         score = 0.0
         
+        # Plain substring checks on purpose: for the handful of keywords a
+        # search has, str.__contains__ is much faster than one regex alternation
         for keyword in keywords:
             # Title matches are most important
             if keyword in title:
@@ -180,36 +257,19 @@ class JobSearchAgent:
         insights = {}
         
         # Top companies
-        companies = {}
-        for job in jobs:
-            company = job.get("company", "Unknown")
-            companies[company] = companies.get(company, 0) + 1
-        
-        insights["top_companies"] = dict(sorted(companies.items(), key=lambda x: x[1], reverse=True))
+        companies = Counter(job.get("company", "Unknown") for job in jobs)
+        insights["top_companies"] = dict(companies.most_common(TOP_INSIGHTS))
         
         # Popular skills (extracted from titles and descriptions)
-        skills = {}
-        skill_keywords = [
-            "python", "java", "javascript", "react", "node", "angular", "vue",
-            "docker", "kubernetes", "aws", "azure", "gcp", "sql", "mongodb",
-            "machine learning", "ai", "data science", "devops", "microservices"
-        ]
-        
+        skills = Counter()
         for job in jobs:
-            text = f"{job.get('title', '')} {job.get('description', '')}".lower()
-            for skill in skill_keywords:
-                if skill in text:
-                    skills[skill] = skills.get(skill, 0) + 1
+            skills.update(_find_skills(f"{_lowered(job, 'title')} {_lowered(job, 'description')}"))
         
-        insights["popular_skills"] = dict(sorted(skills.items(), key=lambda x: x[1], reverse=True))
+        insights["popular_skills"] = dict(skills.most_common(TOP_INSIGHTS))
         
         # Location distribution
-        locations = {}
-        for job in jobs:
-            location = job.get("location", "Unknown")
-            locations[location] = locations.get(location, 0) + 1
-        
-        insights["location_distribution"] = dict(sorted(locations.items(), key=lambda x: x[1], reverse=True))
+        locations = Counter(job.get("location", "Unknown") for job in jobs)
+        insights["location_distribution"] = dict(locations.most_common(TOP_INSIGHTS))
         
         # Basic recommendations
         recommendations = []
@@ -217,11 +277,11 @@ class JobSearchAgent:
         if len(jobs) < 10:
             recommendations.append("Consider broadening your search keywords for more opportunities")
         
-        if criteria.experience_level == "junior" and any("senior" in job.get("title", "").lower() for job in jobs[:5]):
+        if criteria.experience_level == "junior" and any("senior" in _lowered(job, "title") for job in jobs[:5]):
             recommendations.append("Many results show senior roles - consider highlighting transferable skills")
         
-        top_skill = max(skills.items(), key=lambda x: x[1])[0] if skills else None
-        if top_skill:
+        if skills:
+            top_skill = skills.most_common(1)[0][0]
             recommendations.append(f"'{top_skill}' appears frequently - consider emphasizing this skill")
         
         insights["recommendations"] = recommendations
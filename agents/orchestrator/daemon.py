@@ -0,0 +1,286 @@
+"""
+Hire.AI Orchestrator Daemon
+Keeps one HireAIOrchestrator warm in a long-running process so repeated CLI
+invocations skip the AutoGen/OpenAI import and client setup cost.
+
+Clients talk to the daemon over a Unix domain socket using length-prefixed
+JSON messages (4-byte big-endian size followed by a UTF-8 JSON body).
+"""
+
+import os
+import io
+import json
+import struct
+import socket
+import asyncio
+import tempfile
+import stat
+import contextlib
+from typing import Dict, Any, List, Optional
+
+from loguru import logger
+
+_HEADER = struct.Struct(">I")
+# Largest message body either side will buffer (job lists, captured output)
+_MAX_MESSAGE_SIZE = 16 * 1024 * 1024
+
+
+def default_socket_path() -> str:
+    """
+    Get the daemon socket path (HIREAI_SOCKET overrides the per-user default).
+
+    The default lives in $XDG_RUNTIME_DIR, which only the user can access,
+    or else in a private hireai-<uid> directory under the temp dir.
+    """
+    env_path = os.getenv("HIREAI_SOCKET")
+    if env_path:
+        return env_path
+    runtime_dir = os.getenv("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "hireai.sock")
+    return os.path.join(_fallback_socket_dir(), "orchestrator.sock")
+
+
+def _fallback_socket_dir() -> str:
+    """Get the private per-user socket directory used without XDG_RUNTIME_DIR."""
+    uid = os.getuid() if hasattr(os, "getuid") else "user"
+    return os.path.join(tempfile.gettempdir(), f"hireai-{uid}")
+
+
+def _owned_by_current_user(st: os.stat_result) -> bool:
+    """Check a file belongs to the user running this process."""
+    return not hasattr(os, "getuid") or st.st_uid == os.getuid()
+
+
+def _ensure_private_dir(path: str) -> None:
+    """
+    Create the socket's directory as 0700, or check an existing one is ours.
+
+    Raises:
+        RuntimeError: If the directory belongs to another user or is
+            accessible to group/others
+    """
+    try:
+        os.mkdir(path, mode=0o700)
+        return
+    except FileExistsError:
+        pass
+
+    st = os.stat(path)
+    if not _owned_by_current_user(st) or stat.S_IMODE(st.st_mode) & 0o077:
+        raise RuntimeError(
+            f"Refusing to use socket directory {path}: it must be owned by you with mode 0700"
+        )
+
+
+def _encode(message: Dict[str, Any]) -> bytes:
+    """Frame a message for the socket protocol."""
+    body = json.dumps(message, default=str).encode("utf-8")
+    return _HEADER.pack(len(body)) + body
+
+
+async def _read_message(reader: asyncio.StreamReader) -> Dict[str, Any]:
+    """
+    Read one framed message from the socket.
+
+    Raises:
+        ValueError: If the message is too large or its body is not a JSON object
+    """
+    header = await reader.readexactly(_HEADER.size)
+    (size,) = _HEADER.unpack(header)
+    if size > _MAX_MESSAGE_SIZE:
+        raise ValueError(f"Message of {size} bytes exceeds the {_MAX_MESSAGE_SIZE} byte limit")
+
+    message = json.loads(await reader.readexactly(size))
+    if not isinstance(message, dict):
+        raise ValueError("Message must be a JSON object")
+    return message
+
+
+class OrchestratorClient:
+    """
+    Client for a running orchestrator daemon.
+    Exposes the same search_jobs/ask_question/close interface as
+    HireAIOrchestrator so the CLI can use either interchangeably.
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self._reader = reader
+        self._writer = writer
+        self.last_jobs: Optional[List[Dict[str, Any]]] = None
+
+    @classmethod
+    async def connect(cls, socket_path: Optional[str] = None) -> Optional["OrchestratorClient"]:
+        """
+        Connect to the daemon if one is running.
+
+        Args:
+            socket_path: Socket path (defaults to default_socket_path())
+
+        Returns:
+            Connected client, or None if no daemon is listening
+        """
+        path = socket_path or default_socket_path()
+        if not hasattr(socket, "AF_UNIX"):
+            return None
+
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+
+        # Never send queries to a socket planted by another local user
+        if not _owned_by_current_user(st):
+            logger.warning(f"Ignoring daemon socket {path}: owned by another user")
+            return None
+
+        try:
+            reader, writer = await asyncio.open_unix_connection(path)
+        except OSError as e:
+            logger.debug(f"Orchestrator daemon not available at {path}: {e}")
+            return None
+
+        return cls(reader, writer)
+
+    async def _request(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a request and replay the daemon's console output locally."""
+        self._writer.write(_encode(message))
+        await self._writer.drain()
+        response = await _read_message(self._reader)
+
+        if response.get("output"):
+            print(response["output"], end="")
+        return response
+
+    @staticmethod
+    def _result(response: Dict[str, Any]) -> str:
+        """Get the orchestrator's reply string from a daemon response."""
+        if not response.get("success"):
+            return f"Error: {response.get('error', 'Unknown daemon error')}"
+        return response["result"]
+
+    async def search_jobs(self, keywords: str, location: str = "India,Remote", max_results: int = 50) -> str:
+        """Search for jobs through the daemon's orchestrator (sets last_jobs)."""
+        response = await self._request({
+            "op": "search_jobs",
+            "keywords": keywords,
+            "location": location,
+            "max_results": max_results
+        })
+        self.last_jobs = response.get("jobs")
+        return self._result(response)
+
+    async def ask_question(self, question: str) -> str:
+        """Ask a question through the daemon's orchestrator."""
+        return self._result(await self._request({"op": "ask_question", "question": question}))
+
+    async def close(self):
+        """Close the connection to the daemon."""
+        try:
+            self._writer.close()
+            await self._writer.wait_closed()
+        except Exception as e:
+            logger.debug(f"Error closing daemon connection: {str(e)}")
+
+
+# Request op -> orchestrator call
+_OPERATIONS = {
+    "search_jobs": lambda orchestrator, request: orchestrator.search_jobs(
+        keywords=request["keywords"],
+        location=request.get("location", "India,Remote"),
+        max_results=request.get("max_results", 50)
+    ),
+    "ask_question": lambda orchestrator, request: orchestrator.ask_question(request["question"]),
+}
+
+
+async def _dispatch(orchestrator, request: Dict[str, Any]) -> Dict[str, Any]:
+    """Run a single request against the orchestrator, capturing its console output."""
+    operation = _OPERATIONS.get(request.get("op"))
+    if operation is None:
+        return {"success": False, "error": f"Unknown operation: {request.get('op')}"}
+
+    output = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(output):
+            result = await operation(orchestrator, request)
+        response = {"success": True, "result": result, "output": output.getvalue()}
+        if request["op"] == "search_jobs":
+            response["jobs"] = orchestrator.last_jobs
+        return response
+    except Exception as e:
+        logger.error(f"Daemon request failed: {str(e)}")
+        return {"success": False, "error": str(e), "output": output.getvalue()}
+
+
+async def serve(socket_path: Optional[str] = None) -> None:
+    """
+    Run the orchestrator daemon until cancelled.
+
+    Requests are handled one at a time: the agent team keeps conversation
+    state and stdout is captured per request, so they cannot interleave.
+
+    Args:
+        socket_path: Socket path (defaults to default_socket_path())
+    """
+    from agents.orchestrator.main import HireAIOrchestrator
+
+    path = socket_path or default_socket_path()
+    if os.path.dirname(path) == _fallback_socket_dir():
+        _ensure_private_dir(os.path.dirname(path))
+
+    if os.path.exists(path):
+        client = await OrchestratorClient.connect(path)
+        if client is not None:
+            await client.close()
+            raise RuntimeError(f"An orchestrator daemon is already running at {path}")
+        os.unlink(path)  # Stale socket from a previous run
+
+    orchestrator = HireAIOrchestrator()
+    lock = asyncio.Lock()
+
+    async def handle_client(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    request = await _read_message(reader)
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                except ValueError as e:
+                    # The stream can't be trusted after a bad frame: reply and hang up
+                    logger.warning(f"Rejected daemon request: {str(e)}")
+                    response = {"success": False, "error": f"Invalid request: {str(e)}"}
+                    keep_open = False
+                else:
+                    async with lock:
+                        response = await _dispatch(orchestrator, request)
+                    keep_open = True
+
+                try:
+                    writer.write(_encode(response))
+                    await writer.drain()
+                except ConnectionError:
+                    break  # Client went away before reading the reply
+                if not keep_open:
+                    break
+        finally:
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    # Create the socket as 0600 from the start rather than chmod it after binding
+    old_umask = os.umask(0o077)
+    try:
+        server = await asyncio.start_unix_server(handle_client, path=path)
+    finally:
+        os.umask(old_umask)
+    logger.info(f"Orchestrator daemon listening on {path}")
+
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await orchestrator.close()
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(path)
+        logger.info("Orchestrator daemon stopped")
@@ -19,15 +19,23 @@ from autogen_ext.models.openai import OpenAIChatCompletionClient
 from dotenv import load_dotenv
 from loguru import logger
 
+from agents.core.exports import find_latest_export
+
 # Load environment variables
 load_dotenv(".env.agents")
 
+# Jobs parsed by the most recent scrape_jobs call, so the orchestrator can hand
+# them to callers without re-reading the export file
+_last_scraped_jobs: Optional[List[Dict[str, Any]]] = None
+
 # Scraper tool function for AutoGen agents
 async def scrape_jobs(keywords: str, location: str = "India,Remote", max_results: int = 50) -> str:
     """
     Job scraping tool that AutoGen agents can use.
     Calls the Go scraper and returns formatted results.
     """
+    global _last_scraped_jobs
+    
     try:
         logger.info(f"Starting job scrape: {keywords} in {location}")
         
@@ -53,20 +61,16 @@ async def scrape_jobs(keywords: str, location: str = "India,Remote", max_results
             logger.error(error_msg)
             return f"Error: {error_msg}"
         
-        # Try to read the results from exports directory
-        import glob
-        import pandas as pd
-        
         # Find the latest export file
-        json_files = glob.glob("exports/jobs_export_*.json")
-        if not json_files:
+        latest_file = find_latest_export()
+        if latest_file is None:
             return "Error: No job data found after scraping"
         
-        latest_file = max(json_files, key=os.path.getctime)
-        
         with open(latest_file, 'r') as f:
             jobs_data = json.load(f)
         
+        _last_scraped_jobs = jobs_data
+        
         if not jobs_data:
             return "No jobs found matching your criteria."
         
@@ -186,6 +190,9 @@ class HireAIOrchestrator:
             api_key=os.getenv("OPENAI_API_KEY")
         )
         
+        # Jobs scraped during the last search_jobs call (None if no scrape ran)
+        self.last_jobs: Optional[List[Dict[str, Any]]] = None
+        
         # Initialize agents with tools
         self._setup_agents()
         
@@ -280,8 +287,13 @@ Be encouraging, practical, and focused on actionable advice."""
             max_results: Maximum number of results
             
         Returns:
-            String response from the agent team
+            String response from the agent team. Jobs scraped during the run
+            are available afterwards as self.last_jobs.
         """
+        global _last_scraped_jobs
+        
+        _last_scraped_jobs = None
+        self.last_jobs = None
         try:
             prompt = f"""
 Please help me find job opportunities for:
@@ -296,6 +308,7 @@ Use your tools to search for jobs and provide insights. When finished, say TERMI
             
             # Run the agent team
             result = await self.team.run(task=prompt)
+            self.last_jobs = _last_scraped_jobs
             
             # Stream the conversation to console
             for message in result.messages:
@@ -311,6 +324,10 @@ Use your tools to search for jobs and provide insights. When finished, say TERMI
         """
         Ask a general question to the agent team.
         
+        The team and its model client are created once in __init__ and
+        reused for every question, so repeated calls share one HTTP
+        connection pool until close() is called.
+        
         Args:
             question: User's question
             
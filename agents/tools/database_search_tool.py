@@ -5,7 +5,10 @@ This tool provides intelligent search capabilities over stored job data,
 with support for keyword matching, location filtering, and relevance scoring.
 """
 
+import heapq
+import asyncio
 import logging
+from operator import itemgetter
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
 import psycopg2
@@ -70,27 +73,92 @@ class DatabaseSearchTool:
             )
             
             jobs = self.search_jobs(query)
+            return self._build_search_result(jobs, keywords, location)
             
-            # Calculate insights
-            insights = self._generate_search_insights(jobs, keywords)
+        except Exception as e:
+            return self._build_search_error(e)
+    
+    async def intelligent_search_async(self, keywords: List[str], location: Optional[str] = None,
+                                       max_results: int = 25, max_concurrency: int = 8) -> Dict[str, Any]:
+        """
+        Async variant of intelligent_search that queries each keyword concurrently.
+        
+        Each keyword runs as its own query on a worker thread with its own
+        connection, bounded by a semaphore. Per-keyword results are merged,
+        deduplicated and re-ordered like the single OR query would be.
+        
+        Args:
+            keywords: List of keywords to search for
+            location: Optional location filter
+            max_results: Maximum number of results to return
+            max_concurrency: Maximum number of concurrent keyword queries
+            
+        Returns:
+            Dictionary with search results and metadata
+        """
+        try:
+            if len(keywords) <= 1:
+                query = DatabaseSearchQuery(keywords=keywords, location=location, limit=max_results)
+                jobs = await asyncio.to_thread(self.search_jobs, query)
+            else:
+                semaphore = asyncio.Semaphore(max_concurrency)
+                
+                async def search_keyword(keyword: str) -> List[Dict[str, Any]]:
+                    query = DatabaseSearchQuery(keywords=[keyword], location=location, limit=max_results)
+                    async with semaphore:
+                        return await asyncio.to_thread(self.search_jobs, query)
+                
+                async with asyncio.TaskGroup() as tg:
+                    tasks = [tg.create_task(search_keyword(keyword)) for keyword in keywords]
+                
+                jobs = self._merge_keyword_results([task.result() for task in tasks], max_results)
             
-            return {
-                "success": True,
-                "jobs": jobs,
-                "total_found": len(jobs),
-                "insights": insights,
-                "search_terms": keywords,
-                "location_filter": location
-            }
+            return self._build_search_result(jobs, keywords, location)
             
         except Exception as e:
-            self.logger.error(f"Database search failed: {e}")
-            return {
-                "success": False,
-                "error": str(e),
-                "jobs": [],
-                "total_found": 0
-            }
+            if isinstance(e, ExceptionGroup):
+                e = e.exceptions[0]
+            return self._build_search_error(e)
+    
+    def _merge_keyword_results(self, results: List[List[Dict[str, Any]]], limit: int) -> List[Dict[str, Any]]:
+        """Merge per-keyword results, dropping duplicates and keeping the query's ordering."""
+        merged = {}
+        for jobs in results:
+            for job in jobs:
+                key = job.get('id') or (job.get('title'), job.get('company'), job.get('location'))
+                merged.setdefault(key, job)
+        
+        # Same ordering as search_jobs: created_at DESC, relevance_score DESC
+        return heapq.nlargest(
+            limit,
+            merged.values(),
+            key=lambda job: (job.get('created_at') or '', job.get('relevance_score') or 0)
+        )
+    
+    def _build_search_result(self, jobs: List[Dict[str, Any]], keywords: List[str],
+                             location: Optional[str]) -> Dict[str, Any]:
+        """Build the search response for a list of jobs."""
+        # Calculate insights
+        insights = self._generate_search_insights(jobs, keywords)
+        
+        return {
+            "success": True,
+            "jobs": jobs,
+            "total_found": len(jobs),
+            "insights": insights,
+            "search_terms": keywords,
+            "location_filter": location
+        }
+    
+    def _build_search_error(self, error: Exception) -> Dict[str, Any]:
+        """Build the failure response for a search."""
+        self.logger.error(f"Database search failed: {error}")
+        return {
+            "success": False,
+            "error": str(error),
+            "jobs": [],
+            "total_found": 0
+        }
     
     def search_jobs(self, query: DatabaseSearchQuery) -> List[Dict[str, Any]]:
         """
@@ -238,8 +306,8 @@ class DatabaseSearchTool:
         
         return {
             "total_results": len(jobs),
-            "top_companies": sorted(company_counts.items(), key=lambda x: x[1], reverse=True)[:5],
-            "top_locations": sorted(location_counts.items(), key=lambda x: x[1], reverse=True)[:5],
+            "top_companies": heapq.nlargest(5, company_counts.items(), key=itemgetter(1)),
+            "top_locations": heapq.nlargest(5, location_counts.items(), key=itemgetter(1)),
             "sources": source_counts,
             "keywords_used": keywords
         }
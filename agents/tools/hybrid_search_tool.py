@@ -5,8 +5,11 @@ This tool provides intelligent job search by first checking the database for exi
 then optionally performing live scraping to find additional opportunities.
 """
 
+import heapq
+import asyncio
 import logging
-from typing import List, Dict, Any, Optional
+from operator import itemgetter
+from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from agents.core.dependency_injection import injectable
@@ -47,96 +50,157 @@ class HybridSearchTool:
         
         try:
             # Step 1: Search existing database
-            self.logger.info(f"Searching database for keywords: {request.keywords}")
-            db_result = self.db_tool.intelligent_search(
-                keywords=request.keywords,
-                location=request.location,
-                max_results=request.max_results
-            )
-            
-            db_jobs = db_result.get("jobs", [])
-            db_count = len(db_jobs)
-            
-            self.logger.info(f"Found {db_count} jobs in database")
+            db_jobs = self._search_database(request)
             
             # Step 2: Determine if scraping is needed
-            should_scrape = (
-                request.include_scraping and 
-                db_count < request.scrape_threshold
-            )
-            
-            scraping_jobs = []
-            scraping_error = None
+            should_scrape = self._should_scrape(request, len(db_jobs))
             
+            scraping_jobs, scraping_error = [], None
             if should_scrape:
-                self.logger.info("Database results below threshold, initiating live scraping")
-                try:
-                    keywords_str = " ".join(request.keywords)
-                    scrape_result = self.scraper_tool.scrape_jobs(
-                        keywords=keywords_str,
-                        location=request.location or "India,Remote",
-                        max_results=request.max_scrape_results
-                    )
-                    
-                    if scrape_result.get("success"):
-                        scraping_jobs = scrape_result.get("jobs", [])
-                        self.logger.info(f"Scraped {len(scraping_jobs)} additional jobs")
-                    else:
-                        scraping_error = scrape_result.get("error")
-                        self.logger.warning(f"Scraping failed: {scraping_error}")
-                        
-                except Exception as e:
-                    scraping_error = str(e)
-                    self.logger.error(f"Scraping error: {e}")
+                scraping_jobs, scraping_error = self._scrape_live(request)
             
-            # Step 3: Combine and deduplicate results
-            combined_jobs = self._combine_and_rank_jobs(db_jobs, scraping_jobs, request.keywords)
+            return self._build_result(
+                request, db_jobs, scraping_jobs, scraping_error, should_scrape, start_time
+            )
             
-            # Step 4: Limit to requested max results
-            if len(combined_jobs) > request.max_results:
-                combined_jobs = combined_jobs[:request.max_results]
+        except Exception as e:
+            return self._build_error(e)
+    
+    async def asearch_jobs_intelligently(self, request: HybridSearchRequest) -> Dict[str, Any]:
+        """
+        Async variant of search_jobs_intelligently.
+        
+        Both legs run in worker threads. When the database can never satisfy
+        the scrape threshold (max_results below it), scraping is started
+        alongside the database query instead of after it.
+        
+        Args:
+            request: HybridSearchRequest with search parameters
             
-            # Step 5: Generate comprehensive insights
-            insights = self._generate_hybrid_insights(
-                db_jobs, scraping_jobs, combined_jobs, request.keywords, should_scrape
-            )
+        Returns:
+            Dictionary with combined search results and metadata
+        """
+        start_time = datetime.now()
+        
+        try:
+            if request.include_scraping and request.max_results < request.scrape_threshold:
+                async with asyncio.TaskGroup() as tg:
+                    db_task = tg.create_task(asyncio.to_thread(self._search_database, request))
+                    scrape_task = tg.create_task(asyncio.to_thread(self._scrape_live, request))
+                db_jobs = db_task.result()
+                scraping_jobs, scraping_error = scrape_task.result()
+                should_scrape = True
+            else:
+                db_jobs = await asyncio.to_thread(self._search_database, request)
+                should_scrape = self._should_scrape(request, len(db_jobs))
+                
+                scraping_jobs, scraping_error = [], None
+                if should_scrape:
+                    scraping_jobs, scraping_error = await asyncio.to_thread(self._scrape_live, request)
             
-            # Performance metrics
-            end_time = datetime.now()
-            duration = (end_time - start_time).total_seconds()
+            return self._build_result(
+                request, db_jobs, scraping_jobs, scraping_error, should_scrape, start_time
+            )
             
-            return {
-                "success": True,
-                "jobs": combined_jobs,
-                "total_found": len(combined_jobs),
-                "database_count": db_count,
-                "scraping_count": len(scraping_jobs),
-                "scraping_triggered": should_scrape,
-                "scraping_error": scraping_error,
-                "insights": insights,
-                "search_strategy": "hybrid",
-                "performance": {
-                    "duration_seconds": duration,
-                    "database_search_time": "< 1s",
-                    "scraping_triggered": should_scrape
-                },
-                "search_terms": request.keywords,
-                "location_filter": request.location
-            }
+        except Exception as e:
+            if isinstance(e, ExceptionGroup):
+                e = e.exceptions[0]
+            return self._build_error(e)
+    
+    def _search_database(self, request: HybridSearchRequest) -> List[Dict]:
+        """Search the database leg of a hybrid request."""
+        self.logger.info(f"Searching database for keywords: {request.keywords}")
+        db_result = self.db_tool.intelligent_search(
+            keywords=request.keywords,
+            location=request.location,
+            max_results=request.max_results
+        )
+        
+        db_jobs = db_result.get("jobs", [])
+        self.logger.info(f"Found {len(db_jobs)} jobs in database")
+        return db_jobs
+    
+    def _should_scrape(self, request: HybridSearchRequest, db_count: int) -> bool:
+        """Check whether database results are below the scraping threshold."""
+        return request.include_scraping and db_count < request.scrape_threshold
+    
+    def _scrape_live(self, request: HybridSearchRequest) -> Tuple[List[Dict], Optional[str]]:
+        """Run the live scraping leg, returning the jobs and any error message."""
+        self.logger.info("Database results below threshold, initiating live scraping")
+        scraping_jobs = []
+        scraping_error = None
+        try:
+            keywords_str = " ".join(request.keywords)
+            scrape_result = self.scraper_tool.scrape_jobs(
+                keywords=keywords_str,
+                location=request.location or "India,Remote",
+                max_results=request.max_scrape_results
+            )
             
+            if scrape_result.get("success"):
+                scraping_jobs = scrape_result.get("jobs", [])
+                self.logger.info(f"Scraped {len(scraping_jobs)} additional jobs")
+            else:
+                scraping_error = scrape_result.get("error")
+                self.logger.warning(f"Scraping failed: {scraping_error}")
+                
         except Exception as e:
-            self.logger.error(f"Hybrid search failed: {e}")
-            return {
-                "success": False,
-                "error": str(e),
-                "jobs": [],
-                "total_found": 0,
-                "search_strategy": "hybrid"
-            }
+            scraping_error = str(e)
+            self.logger.error(f"Scraping error: {e}")
+        
+        return scraping_jobs, scraping_error
+    
+    def _build_result(self, request: HybridSearchRequest, db_jobs: List[Dict],
+                      scraping_jobs: List[Dict], scraping_error: Optional[str],
+                      should_scrape: bool, start_time: datetime) -> Dict[str, Any]:
+        """Combine both legs into the hybrid search response."""
+        # Step 3 & 4: Combine, deduplicate and keep the top max results
+        combined_jobs = self._combine_and_rank_jobs(
+            db_jobs, scraping_jobs, request.keywords, request.max_results
+        )
+        
+        # Step 5: Generate comprehensive insights
+        insights = self._generate_hybrid_insights(
+            db_jobs, scraping_jobs, combined_jobs, request.keywords, should_scrape
+        )
+        
+        # Performance metrics
+        end_time = datetime.now()
+        duration = (end_time - start_time).total_seconds()
+        
+        return {
+            "success": True,
+            "jobs": combined_jobs,
+            "total_found": len(combined_jobs),
+            "database_count": len(db_jobs),
+            "scraping_count": len(scraping_jobs),
+            "scraping_triggered": should_scrape,
+            "scraping_error": scraping_error,
+            "insights": insights,
+            "search_strategy": "hybrid",
+            "performance": {
+                "duration_seconds": duration,
+                "database_search_time": "< 1s",
+                "scraping_triggered": should_scrape
+            },
+            "search_terms": request.keywords,
+            "location_filter": request.location
+        }
+    
+    def _build_error(self, error: Exception) -> Dict[str, Any]:
+        """Build the failure response for a hybrid search."""
+        self.logger.error(f"Hybrid search failed: {error}")
+        return {
+            "success": False,
+            "error": str(error),
+            "jobs": [],
+            "total_found": 0,
+            "search_strategy": "hybrid"
+        }
     
     def _combine_and_rank_jobs(self, db_jobs: List[Dict], scraping_jobs: List[Dict], 
-                              keywords: List[str]) -> List[Dict]:
-        """Combine database and scraped jobs, removing duplicates and ranking by relevance."""
+                              keywords: List[str], limit: int) -> List[Dict]:
+        """Combine database and scraped jobs, removing duplicates and keeping the top `limit` by relevance."""
         combined = []
         seen_jobs = set()
         
@@ -158,10 +222,8 @@ class HybridSearchTool:
                 combined.append(job)
                 seen_jobs.add(job_key)
         
-        # Sort by relevance score (higher is better)
-        combined.sort(key=lambda x: x.get("relevance_score", 0), reverse=True)
-        
-        return combined
+        # Select by relevance score (higher is better) without sorting everything
+        return heapq.nlargest(limit, combined, key=lambda x: x.get("relevance_score", 0))
     
     def _generate_job_key(self, job: Dict) -> str:
         """Generate a unique key for job deduplication."""
@@ -243,7 +305,7 @@ class HybridSearchTool:
         for company in companies:
             company_counts[company] = company_counts.get(company, 0) + 1
         
-        insights["top_companies"] = sorted(company_counts.items(), key=lambda x: x[1], reverse=True)[:5]
+        insights["top_companies"] = heapq.nlargest(5, company_counts.items(), key=itemgetter(1))
         
         # Analyze locations
         locations = [job.get('location', 'Unknown') for job in combined_jobs if job.get('location')]
@@ -251,7 +313,7 @@ class HybridSearchTool:
         for location in locations:
             location_counts[location] = location_counts.get(location, 0) + 1
         
-        insights["top_locations"] = sorted(location_counts.items(), key=lambda x: x[1], reverse=True)[:5]
+        insights["top_locations"] = heapq.nlargest(5, location_counts.items(), key=itemgetter(1))
         
         # Analyze relevance scores
         relevance_scores = [job.get("relevance_score", 0) for job in combined_jobs]
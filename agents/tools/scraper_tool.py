@@ -17,15 +17,19 @@ from agents.core.exceptions import (
     ToolError, ValidationError, ScrapingError
 )
 from agents.core.config import get_global_config
+from agents.core.exports import find_latest_export
 from agents.core.logging_config import get_logger
 from agents.core.resilience import (
-    retry_with_backoff, RetryConfig, timeout,
+    retry_with_backoff, RetryConfig,
     resilient_external_service
 )
 from agents.core.dependency_injection import injectable
 
 logger = get_logger(__name__)
 
+# Upper bound for one Go scraper run; subprocess.run kills the child past it
+SCRAPE_TIMEOUT_SECONDS = 300
+
 
 @injectable
 class JobScraperTool:
@@ -77,7 +81,6 @@ class JobScraperTool:
         base_delay=2.0,
         retryable_exceptions=(ScrapingError, subprocess.TimeoutExpired)
     ))
-    @timeout(300)  # 5 minute timeout
     def scrape_jobs(
         self,
         keywords: str,
@@ -115,7 +118,9 @@ class JobScraperTool:
         location = location or self.config.default_location
         config_path = config or self.config.config_path
         max_results = max_results or self.config.default_max_results
-        timeout_val = timeout_seconds or self.config.timeout
+        # Bounded by subprocess.run, which kills the Go process and raises
+        # TimeoutExpired (reported as a retryable ScrapingError)
+        timeout_val = min(timeout_seconds or self.config.timeout, SCRAPE_TIMEOUT_SECONDS)
         
         logger.info(f"Starting job scraping: keywords='{keywords}', location='{location}'")
         
@@ -163,7 +168,7 @@ class JobScraperTool:
             
         except subprocess.TimeoutExpired:
             raise ScrapingError(
-                f"Scraping timed out after {timeout} seconds",
+                f"Scraping timed out after {timeout_val} seconds",
                 source="go_scraper",
                 operation="scrape_jobs"
             )
@@ -278,18 +283,14 @@ class JobScraperTool:
                         continue
             
             if jobs_data is None:
-                # Try to find any export file
-                exports_dir = self.base_dir / "exports"
-                if exports_dir.exists():
-                    json_files = list(exports_dir.glob("jobs_export_*.json"))
-                    if json_files:
-                        # Get the most recent file
-                        latest_file = max(json_files, key=lambda p: p.stat().st_mtime)
-                        try:
-                            with open(latest_file, 'r', encoding='utf-8') as f:
-                                jobs_data = json.load(f)
-                        except (json.JSONDecodeError, IOError):
-                            pass
+                # Fall back to the most recent export file (single scandir pass)
+                latest_file = find_latest_export(str(self.base_dir / "exports"))
+                if latest_file is not None:
+                    try:
+                        with open(latest_file, 'r', encoding='utf-8') as f:
+                            jobs_data = json.load(f)
+                    except (json.JSONDecodeError, IOError):
+                        pass
             
             if jobs_data is None:
                 logger.warning("No job data found")
@@ -8,23 +8,28 @@ for all agent components following industry best practices.
 import pytest
 import asyncio
 import json
+import subprocess
 from unittest.mock import Mock, patch, AsyncMock
 from typing import Dict, Any, List
 import tempfile
 import os
+import sys
 from pathlib import Path
 
 # Import the modules to test
 from agents.core.config import AgentConfig, get_config
 from agents.core.exceptions import (
     ConfigurationError, ValidationError, ToolError, 
-    ScrapingError, AgentError, OrchestrationError
+    ScrapingError, AgentError, OrchestrationError,
+    TimeoutError as AgentTimeoutError
 )
 from agents.core.resilience import (
     CircuitBreaker, CircuitBreakerConfig, CircuitState,
-    RateLimiter, RateLimitConfig, retry_with_backoff, RetryConfig
+    RateLimiter, RateLimitConfig, ShardedRateLimiter, retry_with_backoff, RetryConfig, timeout
 )
 from agents.core.dependency_injection import ServiceContainer, ServiceLifetime
+from agents.core.cache import SearchResultCache
+from agents.core.config_manager import AdvancedConfigManager, ConfigEncryption, Environment, _ENV_PROFILES
 from agents.tools.scraper_tool import JobScraperTool
 from agents.job_search.agent import JobSearchAgent, JobSearchCriteria
 from agents.orchestrator.main import HireAIOrchestrator, JobSearchRequest
@@ -115,6 +120,24 @@ class TestResilience:
         # Should reject 6th request
         assert rate_limiter.acquire() is False
     
+    def test_rate_limiter_burst_size_caps_bucket(self):
+        """Test burst_size limits how many calls can go through at once."""
+        rate_limiter = RateLimiter(RateLimitConfig(max_calls=100, time_window=60.0, burst_size=3))
+        
+        assert [rate_limiter.acquire() for _ in range(4)] == [True, True, True, False]
+    
+    def test_sharded_rate_limiter_isolates_keys(self):
+        """Test each key draws from its own shard's share of the limit."""
+        rate_limiter = ShardedRateLimiter(RateLimitConfig(max_calls=8, time_window=60.0), shards=4)
+        
+        assert [rate_limiter.acquire(0) for _ in range(3)] == [True, True, False]
+        assert rate_limiter.acquire(1) is True
+        
+        with pytest.raises(ValueError):
+            ShardedRateLimiter(RateLimitConfig(), shards=3)
+        with pytest.raises(ValueError):
+            ShardedRateLimiter(RateLimitConfig(max_calls=10), shards=16)
+    
     def test_retry_with_backoff_success_after_failure(self):
         """Test retry logic succeeds after initial failure."""
         call_count = 0
@@ -139,6 +162,55 @@ class TestResilience:
         
         with pytest.raises(ConnectionError):
             always_failing_function()
+    
+    def test_retry_decorrelated_jitter_stays_in_bounds(self):
+        """Test decorrelated jitter delays stay between base_delay and max_delay."""
+        config = RetryConfig(max_attempts=6, base_delay=0.001, max_delay=0.004)
+        
+        @retry_with_backoff(config)
+        def always_failing_function():
+            raise ConnectionError("Persistent failure")
+        
+        with patch("agents.core.resilience.time.sleep") as mock_sleep:
+            with pytest.raises(ConnectionError):
+                always_failing_function()
+        
+        delays = [call.args[0] for call in mock_sleep.call_args_list]
+        assert len(delays) == 5
+        assert all(0.001 <= delay <= 0.004 for delay in delays)
+    
+    def test_retry_single_attempt_is_not_wrapped(self):
+        """Test a single-attempt retry config leaves the function untouched."""
+        def single_shot():
+            return "success"
+        
+        assert retry_with_backoff(RetryConfig(max_attempts=1))(single_shot) is single_shot
+    
+    def test_sync_timeout_is_enforced(self):
+        """Test sync functions are cut off once the timeout passes."""
+        import time
+        
+        @timeout(0.01)
+        def slow_function():
+            time.sleep(0.2)
+        
+        with pytest.raises(AgentTimeoutError):
+            slow_function()
+    
+    def test_sync_timeout_keeps_context(self):
+        """Test contextvars set by the caller are visible inside a timed call."""
+        import contextvars
+        request_id = contextvars.ContextVar("request_id", default=None)
+        
+        @timeout(1)
+        def read_request_id():
+            return request_id.get()
+        
+        token = request_id.set("abc")
+        try:
+            assert read_request_id() == "abc"
+        finally:
+            request_id.reset(token)
 
 
 class TestDependencyInjection:
@@ -193,6 +265,53 @@ class TestDependencyInjection:
         user_service = container.get_required_service(UserService)
         assert user_service.db.connection == "db_connection"
     
+    def test_constructor_plan_is_cached(self):
+        """Test constructor signatures are inspected once, at registration."""
+        from typing import get_type_hints
+        
+        container = ServiceContainer()
+        
+        class DatabaseService:
+            def __init__(self):
+                self.connection = "db_connection"
+        
+        class UserService:
+            def __init__(self, db: DatabaseService, retries: int = 3):
+                self.db = db
+                self.retries = retries
+        
+        with patch('agents.core.dependency_injection.get_type_hints', wraps=get_type_hints) as type_hints:
+            container.register(DatabaseService, DatabaseService)
+            container.register(UserService, UserService)
+            first = container.get_required_service(UserService)
+            second = container.get_required_service(UserService)
+        
+        assert first is not second
+        assert second.db.connection == "db_connection"
+        assert second.retries == 3
+        assert type_hints.call_count == 1
+    
+    def test_scoped_instances_per_scope(self):
+        """Test scoped services are shared within a scope and not across scopes."""
+        container = ServiceContainer()
+        
+        class RequestContext:
+            def __init__(self):
+                self.value = "request"
+        
+        container.register_scoped(RequestContext, RequestContext)
+        outside = container.get_required_service(RequestContext)
+        
+        with container.create_scope():
+            first = container.get_required_service(RequestContext)
+            assert first is container.get_required_service(RequestContext)
+            
+            with container.create_scope():
+                assert container.get_required_service(RequestContext) is not first
+        
+        assert first is not outside
+        assert container.get_required_service(RequestContext) is outside
+    
     def test_service_not_registered(self):
         """Test error when service not registered."""
         container = ServiceContainer()
@@ -204,6 +323,89 @@ class TestDependencyInjection:
             container.get_required_service(UnregisteredService)
 
 
+class TestConfigEncryption:
+    """Test encryption of sensitive config values with each Fernet backend."""
+    
+    def test_round_trip_with_cryptography(self):
+        """Test values round-trip with the cryptography backend."""
+        fernet = pytest.importorskip("cryptography.fernet")
+        
+        with patch.dict(sys.modules, {"rfernet": None}):
+            encryption = ConfigEncryption(fernet.Fernet.generate_key().decode())
+        
+        token = encryption.encrypt_value("sk-secret")
+        assert token.startswith("gAAAA")
+        assert encryption.decrypt_value(token) == "sk-secret"
+    
+    def test_round_trip_with_rfernet(self):
+        """Test values round-trip with the rfernet backend."""
+        rfernet = pytest.importorskip("rfernet")
+        
+        encryption = ConfigEncryption(rfernet.Fernet.generate_new_key())
+        
+        token = encryption.encrypt_value("sk-secret")
+        assert token.startswith("gAAAA")
+        assert encryption.decrypt_value(token) == "sk-secret"
+
+
+class TestConfigManager:
+    """Test the advanced configuration manager."""
+    
+    def test_env_booleans_are_coerced(self):
+        """Test 0/1/yes/no env values become booleans and junk is skipped."""
+        manager = AdvancedConfigManager.__new__(AdvancedConfigManager)
+        
+        with patch.dict(os.environ, {"DEBUG": "0"}):
+            assert manager._load_from_environment()["debug"] is False
+        with patch.dict(os.environ, {"DEBUG": "Yes"}):
+            assert manager._load_from_environment()["debug"] is True
+        with patch.dict(os.environ, {"DEBUG": "maybe"}):
+            assert "debug" not in manager._load_from_environment()
+    
+    def test_unknown_section_keys_are_rejected(self):
+        """Test a misspelled section key fails instead of using defaults."""
+        manager = AdvancedConfigManager.__new__(AdvancedConfigManager)
+        
+        with pytest.raises(ConfigurationError):
+            manager._create_config_object({"database": {"hostname": "db"}})
+    
+    def test_every_environment_has_a_profile(self):
+        """Test load_env_config has a profile for each Environment."""
+        assert set(_ENV_PROFILES) == set(Environment)
+
+
+class TestSearchResultCache:
+    """Test on-disk search result cache."""
+    
+    def test_cache_roundtrip(self):
+        """Test cached results are returned for the same query."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = SearchResultCache(cache_dir=temp_dir)
+            key = cache.make_key(command="database", keywords=["python", "django"])
+            
+            assert cache.get(key) is None
+            cache.set(key, {"success": True, "jobs": [{"title": "Python Developer"}]})
+            assert cache.get(key)["jobs"][0]["title"] == "Python Developer"
+    
+    def test_cache_key_ignores_keyword_order(self):
+        """Test keyword order does not change the cache key."""
+        key1 = SearchResultCache.make_key(keywords=["python", "django"], location="Remote")
+        key2 = SearchResultCache.make_key(keywords=["django", "python"], location="Remote")
+        key3 = SearchResultCache.make_key(keywords=["python", "django"], location="Mumbai")
+        
+        assert key1 == key2
+        assert key1 != key3
+    
+    def test_cache_entry_expires(self):
+        """Test expired entries are treated as misses."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = SearchResultCache(cache_dir=temp_dir, ttl_seconds=-1)
+            key = cache.make_key(keywords=["python"])
+            cache.set(key, {"success": True})
+            
+            assert cache.get(key) is None
+
+
 class TestJobScraperTool:
     """Test job scraper tool."""
     
@@ -269,6 +471,32 @@ class TestJobScraperTool:
             
             with pytest.raises(ScrapingError):
                 tool.scrape_jobs("python developer")
+    
+    @patch('agents.core.resilience.time.sleep')
+    @patch('subprocess.run')
+    def test_scrape_jobs_timeout_is_retried(self, mock_run, mock_sleep):
+        """Test a scraper timeout surfaces as a retried ScrapingError."""
+        mock_run.side_effect = subprocess.TimeoutExpired(cmd="scraper", timeout=300)
+        
+        mock_config = Mock()
+        mock_config.scraper = Mock(
+            binary_path=Path("/fake/scraper"),
+            base_dir=Path("/fake/base"),
+            default_location="India,Remote",
+            config_path="config/test.json",
+            default_max_results=50,
+            timeout=600
+        )
+        
+        with patch('agents.tools.scraper_tool.get_global_config', return_value=mock_config):
+            with patch.object(JobScraperTool, '_validate_setup'):
+                tool = JobScraperTool()
+                
+                with pytest.raises(ScrapingError, match="timed out after 300 seconds"):
+                    tool.scrape_jobs("python developer")
+        
+        assert mock_run.call_count == 3
+        assert mock_run.call_args.kwargs["timeout"] == 300
 
 
 class TestJobSearchAgent:
@@ -429,6 +657,18 @@ class TestExceptionHandling:
         
         assert error.tool_name == "JobScraperTool"
         assert error.operation == "scrape_jobs"
+    
+    def test_error_details_are_copied(self):
+        """Test later changes to the caller's details dict don't leak into the error."""
+        from agents.core.exceptions import HireAIError
+        details = {"attempt": 1}
+        error = HireAIError("Request failed", details)
+        message = str(error)
+        
+        details["attempt"] = 2
+        
+        assert error.details["attempt"] == 1
+        assert str(error) == message
 
 
 class TestIntegration: